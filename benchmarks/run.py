@@ -0,0 +1,212 @@
+"""Stage benchmarks for the dashboard data path.
+
+    python -m benchmarks.run --sizes 1000,10000,100000
+    python -m benchmarks.run --sizes 1000 --with-load --save-baseline
+    python -m benchmarks.run --sizes 1000 --imports
+
+Each stage is timed (best of --repeat runs) and run once more under
+tracemalloc for its peak allocation. Results are compared with the stored
+baseline and the exit status is 1 when a stage regresses past --tolerance.
+With --imports, the import time of the app's top-level imports and of the
+modules it loads lazily is measured too, each in a fresh interpreter.
+"""
+import argparse
+import ast
+import calendar
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import EXCEL_MAX_ROWS, generate_frames, write_workbook
+from kol_core.activity_log import ActivityLogIndex
+from kol_core.charts import cap_rows, monthly_volume, status_counts, target_by_area
+from kol_core.constants import YEAR, MONTH_MAP, MONTH_LIST_SORTED
+from kol_core.db import SQLiteBackend, build_database
+from kol_core.loader import clean_frames, load_frames, read_workbook
+from kol_core.geo import map_points, precompute_clusters
+from kol_core.kol_index import KolIndex
+from kol_core.metrics import compute_dashboard, compute_pacing_trend, plan_master
+from kol_core.normalize import normalize_activities, normalization_report
+from kol_core.schedule import build_all_calendar_events, build_calendar_events
+from kol_core.store import PartitionedStore
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(REPO_ROOT, "kol_dashboard_r.py")
+# Loaded by the Executive page when it first renders a chart, the map or the calendar.
+LAZY_IMPORTS = {
+    "import_altair": "import altair",
+    "import_folium": "import folium",
+    "import_streamlit_folium": "from streamlit_folium import st_folium",
+    "import_streamlit_calendar": "from streamlit_calendar import calendar",
+}
+
+def _month_end(month_num):
+    return pd.Timestamp(YEAR, month_num, calendar.monthrange(YEAR, month_num)[1])
+
+def measure(fn, repeat=3):
+    seconds = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        seconds = min(seconds, time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(seconds, 6), "peak_mb": round(peak / 2**20, 3)}
+
+def stages_for(df_plan, df_actual, as_of_month, workbook_path=None, store=None, db=None):
+    # Later stages get the tracking rows as the store hands them out, normalized at ingest.
+    as_of = _month_end(MONTH_MAP[as_of_month])
+    df_raw_actual, df_actual = df_actual, normalize_activities(df_actual)
+    month_ends = [_month_end(n) for n in MONTH_MAP.values() if _month_end(n) <= as_of]
+    kol_ids = df_plan['KOL_ID'].unique()
+    stages = {}
+    if workbook_path:
+        stages["load_workbook"] = lambda: read_workbook(workbook_path, "contracts", "tracking")
+        stages["load_cached"] = lambda: load_frames(workbook_path, "contracts", "tracking")
+    if store:
+        stages["store_load"] = lambda: store.load(as_of.year)
+    if db:
+        stages["sqlite_dashboard"] = lambda: db.dashboard(as_of)
+        stages["sqlite_log_page"] = lambda: db.activity_log(as_of.year, month=as_of_month, sort_by="Name", page=2)
+    stages["normalize"] = lambda: normalization_report(normalize_activities(df_raw_actual))
+    stages["dashboard"] = lambda: compute_dashboard(df_plan, df_actual, as_of)
+    stages["calendar_events"] = lambda: build_calendar_events(df_actual, as_of_month, kol_ids)
+    stages["calendar_all_months"] = lambda: build_all_calendar_events(df_actual, kol_ids)
+    stages["trend_loop"] = lambda: [compute_dashboard(df_plan, df_actual, d) for d in month_ends]
+    stages["trend"] = lambda: compute_pacing_trend(df_plan, df_actual, month_ends)
+    stages["log_index"] = lambda: ActivityLogIndex(df_actual).query(month=as_of_month, sort_by="Name", page=2)
+    stages["map_clusters"] = lambda: precompute_clusters(map_points(plan_master(df_plan)[1]))
+    df_dashboard = compute_dashboard(df_plan, df_actual, as_of)[0]
+    stages["chart_data"] = lambda: (monthly_volume(df_actual), target_by_area(df_dashboard), status_counts(df_dashboard),
+                                    cap_rows(df_dashboard, 'Name', 'Target_Count'), cap_rows(df_dashboard, 'Contract_Start', 'Target_Count'))
+    stages["kol_index"] = lambda: KolIndex(df_dashboard)
+    kol_index = KolIndex(df_dashboard)
+    probe = kol_index.names[len(kol_index.names) // 2]
+    stages["kol_search"] = lambda: (kol_index.search(probe[:8]), kol_index.search(probe[4:12].replace("a", "e")), kol_index.record(probe))
+    return stages
+
+def app_imports(script_path=APP_SCRIPT):
+    """The module-level import statements of the app script, as source."""
+    with open(script_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def import_seconds(source, repeat=3):
+    """Best time to run the import statements in source in a fresh interpreter, without its own start-up."""
+    code = f"import time\nt0 = time.perf_counter()\n{source}\nprint(time.perf_counter() - t0)"
+    seconds = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+        seconds = min(seconds, float(out.split()[-1]))
+    return round(seconds, 6)
+
+def run_imports(repeat=3, only=None):
+    stages = {"import_app": app_imports(), **LAZY_IMPORTS}
+    results = {}
+    for name, source in stages.items():
+        if only and name not in only: continue
+        try:
+            results[name] = {"seconds": import_seconds(source, repeat)}
+        except subprocess.CalledProcessError as e:
+            print(f"{'imports':>14}  {name:<16} failed: {e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e}", flush=True)
+            continue
+        print(f"{'imports':>14}  {name:<16} {results[name]['seconds']:>9.4f}s", flush=True)
+    return results
+
+def run(sizes, rows_per_kol=4, as_of_month="December", repeat=3, with_load=False, only=None, seed=0, imports=False):
+    results = {}
+    for n_kols in sizes:
+        raw_plan, raw_actual = generate_frames(n_kols, n_kols * rows_per_kol, seed)
+        df_plan, df_actual = clean_frames(raw_plan, raw_actual)
+        with tempfile.TemporaryDirectory() as tmp:
+            workbook_path = None
+            if with_load and len(raw_actual) <= EXCEL_MAX_ROWS:
+                workbook_path = write_workbook(os.path.join(tmp, "synthetic.xlsx"), raw_plan, raw_actual)
+                load_frames(workbook_path, "contracts", "tracking")
+            store = PartitionedStore(os.path.join(tmp, "store"))
+            store.ingest(df_plan, df_actual, YEAR, "synthetic")
+            db_path = os.path.join(tmp, "kol.db")
+            build_database(store, db_path)
+            size_results = {}
+            for name, fn in stages_for(df_plan, df_actual, as_of_month, workbook_path, store, SQLiteBackend(db_path)).items():
+                if only and name not in only: continue
+                size_results[name] = measure(fn, repeat)
+                size_results[name]["rows"] = len(df_actual)
+                print(f"{n_kols:>8,} KOLs  {name:<16} {size_results[name]['seconds']:>9.4f}s  {size_results[name]['peak_mb']:>9.1f} MB", flush=True)
+            results[str(n_kols)] = size_results
+    current = {
+        "meta": {"python": platform.python_version(), "pandas": pd.__version__, "machine": platform.machine(),
+                 "rows_per_kol": rows_per_kol, "as_of_month": as_of_month, "repeat": repeat},
+        "results": results
+    }
+    if imports: current["imports"] = run_imports(repeat, only)
+    return current
+
+def compare(current, baseline, tolerance=1.5, memory_tolerance=1.2, min_seconds=0.05):
+    # Sub-min_seconds differences are timer noise, not regressions.
+    regressions = []
+    for size, stages in current["results"].items():
+        for name, cur in stages.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if not base: continue
+            time_ratio = cur["seconds"] / base["seconds"] if base["seconds"] else 1.0
+            mem_ratio = cur["peak_mb"] / base["peak_mb"] if base["peak_mb"] else 1.0
+            slower = time_ratio > tolerance and cur["seconds"] - base["seconds"] > min_seconds
+            flag = slower or mem_ratio > memory_tolerance
+            print(f"{int(size):>8,} KOLs  {name:<16} time x{time_ratio:5.2f}  memory x{mem_ratio:5.2f}{'  REGRESSION' if flag else ''}")
+            if flag: regressions.append((size, name, time_ratio, mem_ratio))
+    for name, cur in current.get("imports", {}).items():
+        base = baseline.get("imports", {}).get(name)
+        if not base: continue
+        time_ratio = cur["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        flag = time_ratio > tolerance and cur["seconds"] - base["seconds"] > min_seconds
+        print(f"{'imports':>14}  {name:<16} time x{time_ratio:5.2f}{'  REGRESSION' if flag else ''}")
+        if flag: regressions.append(("imports", name, time_ratio, 1.0))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the KOL dashboard data path on synthetic data.")
+    parser.add_argument("--sizes", default="1000,10000", help="comma-separated KOL counts")
+    parser.add_argument("--rows-per-kol", type=int, default=4)
+    parser.add_argument("--as-of", default="December", choices=MONTH_LIST_SORTED)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", default=None, help="comma-separated subset of stages")
+    parser.add_argument("--with-load", action="store_true", help="also write and parse a workbook (slow for large sizes)")
+    parser.add_argument("--imports", action="store_true", help="also time the app's imports in fresh interpreters")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown ratio")
+    parser.add_argument("--memory-tolerance", type=float, default=1.2, help="allowed peak memory ratio")
+    parser.add_argument("--out", default=None, help="write results JSON here")
+    args = parser.parse_args(argv)
+    
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    only = set(args.stages.split(",")) if args.stages else None
+    current = run(sizes, args.rows_per_kol, args.as_of, args.repeat, args.with_load, only, imports=args.imports)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f: json.dump(current, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f: json.dump(current, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f: baseline = json.load(f)
+    regressions = compare(current, baseline, args.tolerance, args.memory_tolerance)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
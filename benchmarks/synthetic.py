@@ -0,0 +1,101 @@
+"""Synthetic contracts/tracking data shaped like the KOL workbook.
+
+    python -m benchmarks.synthetic --kols 1000 --rows 20000 --out synthetic.xlsx
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import YEAR, MONTH_LIST_SORTED, ACTIVITY_TO_TASK_MAP
+
+EXCEL_MAX_ROWS = 1_048_575
+
+COUNTRIES = {
+    "Europe": [("UK", 55.38, -3.44), ("Sweden", 59.33, 18.07), ("France", 48.86, 2.35), ("Germany", 51.17, 10.45), ("Spain", 40.46, -3.75)],
+    "North America": [("USA", 37.09, -95.71), ("Canada", 56.13, -106.35), ("Mexico", 23.63, -102.55)],
+    "Asia": [("Korea", 35.91, 127.77), ("Japan", 36.20, 138.25), ("China", 35.86, 104.20), ("India", 20.59, 78.96)],
+    "Oceania": [("Australia", -25.27, 133.78), ("New Zealand", -40.90, 174.89)],
+    "Latin America": [("Brazil", -14.24, -51.93), ("Chile", -35.68, -71.54)]
+}
+TIMES = ["per year", "per quarter", "per month"]
+UNMAPPED_ACTIVITIES = ["Contract", "MOS Test", "i900c shipment", "i900MTest", "Auraview Test"]
+FIRST_NAMES = np.array(["Robert", "Filip", "Alexandre", "Min", "Hana", "Lucas", "Sofia", "Arjun", "Mei", "Diego", "Emma", "Noah", "Yuki", "Omar", "Chloe"])
+LAST_NAMES = np.array(["Jung", "Rebelo", "Richard", "Kim", "Sato", "Silva", "Rossi", "Patel", "Chen", "Garcia", "Muller", "Smith", "Tanaka", "Haddad", "Martin"])
+
+def _countries():
+    rows = [(area, country, lat, lon) for area, items in COUNTRIES.items() for country, lat, lon in items]
+    return pd.DataFrame(rows, columns=["Area", "Country", "Lat", "Lon"])
+
+def generate_frames(n_kols=1000, n_tracking_rows=None, seed=0):
+    """Return raw (contracts, tracking) frames with the workbook's columns.
+
+    n_tracking_rows defaults to roughly four activities per KOL.
+    """
+    rng = np.random.default_rng(seed)
+    n_tracking_rows = n_kols * 4 if n_tracking_rows is None else n_tracking_rows
+    countries = _countries()
+    
+    kol_ids = 100000 + np.arange(1, n_kols + 1)
+    names = np.char.add(np.char.add("Dr. ", rng.choice(FIRST_NAMES, n_kols)), np.char.add(" ", rng.choice(LAST_NAMES, n_kols)))
+    names = np.char.add(names, np.char.add(" ", kol_ids.astype(str)))
+    home = countries.iloc[rng.integers(0, len(countries), n_kols)].reset_index(drop=True)
+    start = pd.to_datetime(f"{YEAR}-01-01") + pd.to_timedelta(rng.integers(0, 180, n_kols), unit="D")
+    end = pd.Series(pd.to_datetime(f"{YEAR}-12-31"), index=range(n_kols))
+    end[rng.random(n_kols) < 0.05] = pd.NaT
+    
+    tasks = np.array(sorted(set(ACTIVITY_TO_TASK_MAP.values())))
+    task_activity = {t: [a for a, m in ACTIVITY_TO_TASK_MAP.items() if m == t] for t in tasks}
+    tasks_per_kol = rng.integers(1, 4, n_kols)
+    owner = np.repeat(np.arange(n_kols), tasks_per_kol)
+    plan_tasks = tasks[rng.integers(0, len(tasks), len(owner))]
+    df_plan = pd.DataFrame({
+        "Name": names[owner], "KOL_ID": kol_ids[owner].astype(float),
+        "Area": home["Area"].to_numpy()[owner], "Country": home["Country"].to_numpy()[owner],
+        "Contract Value(USD)": np.nan,
+        "Contract Start": start[owner], "Contract End": end.to_numpy()[owner],
+        "Days Left": "",
+        "Task": plan_tasks, "Activity": [task_activity[t][0] for t in plan_tasks],
+        "Times": rng.choice(TIMES, len(owner)), "Frequency": rng.integers(1, 5, len(owner)).astype(float),
+        "Lat": home["Lat"].to_numpy()[owner] + rng.normal(0, 1.5, len(owner)),
+        "Lon": home["Lon"].to_numpy()[owner] + rng.normal(0, 1.5, len(owner))
+    }).drop_duplicates(subset=["KOL_ID", "Task"], ignore_index=True)
+    
+    activities = np.array(list(ACTIVITY_TO_TASK_MAP) + UNMAPPED_ACTIVITIES)
+    who = rng.integers(0, n_kols, n_tracking_rows)
+    month_idx = rng.integers(0, 12, n_tracking_rows)
+    # A 5th week only exists in months with at least 29 days.
+    max_week = np.where(month_idx == 1, 4, 5)
+    week_num = rng.integers(1, max_week + 1)
+    df_actual = pd.DataFrame({
+        "Name": names[who], "KOL_ID": kol_ids[who].astype(float),
+        "Area": home["Area"].to_numpy()[who], "Country": home["Country"].to_numpy()[who],
+        "Quarter": np.char.add("Q", (month_idx // 3 + 1).astype(str)),
+        "Month": np.array(MONTH_LIST_SORTED)[month_idx],
+        "Week": np.char.add(week_num.astype(str), "w"),
+        "Activity": rng.choice(activities, n_tracking_rows),
+        "Count": np.nan
+    })
+    return df_plan, df_actual
+
+def write_workbook(path, df_plan, df_actual, contract_tab="contracts", tracking_tab="tracking"):
+    if max(len(df_plan), len(df_actual)) > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel sheets are limited to {EXCEL_MAX_ROWS:,} data rows")
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        df_plan.to_excel(writer, sheet_name=contract_tab, index=False)
+        df_actual.to_excel(writer, sheet_name=tracking_tab, index=False)
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic KOL workbook.")
+    parser.add_argument("--kols", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=None, help="tracking rows (default: 4 per KOL)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+    df_plan, df_actual = generate_frames(args.kols, args.rows, args.seed)
+    write_workbook(args.out, df_plan, df_actual)
+    print(f"wrote {args.out}: {len(df_plan):,} contract rows, {len(df_actual):,} tracking rows")
+
+if __name__ == "__main__":
+    main()
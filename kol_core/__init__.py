@@ -0,0 +1,6 @@
+"""Streamlit-free data loading and KPI computation for the KOL dashboard."""
+from kol_core.loader import load_frames, read_workbook
+from kol_core.metrics import compute_dashboard, compute_pacing_trend, average_pacing
+from kol_core.store import PartitionedStore
+
+__all__ = ["load_frames", "read_workbook", "compute_dashboard", "compute_pacing_trend", "average_pacing", "PartitionedStore"]
@@ -0,0 +1,72 @@
+"""Position index over the tracking log for the Admin Activity Log view.
+
+Filters resolve to precomputed row-position arrays (per Area, per Month, per
+KOL) that are intersected, sorted by precomputed column ranks and sliced,
+so only the requested page of rows is ever materialized.
+"""
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import MONTH_LIST_SORTED
+from kol_core.normalize import normalize_activities
+
+def _positions_by(values):
+    return {key: np.asarray(pos, dtype=np.int64) for key, pos in values.groupby(values, sort=True, dropna=True, observed=True).indices.items()}
+
+class ActivityLogIndex:
+    def __init__(self, df_actual):
+        self.df = df_actual
+        self.n_rows = len(df_actual)
+        self.by_area = _positions_by(df_actual['Area'])
+        # Keyed by canonical month name, whatever the case or spacing of the sheet's Month text.
+        month_num = normalize_activities(df_actual)['Month_Num']
+        self.by_month = {MONTH_LIST_SORTED[n - 1]: pos for n, pos in _positions_by(month_num).items()}
+        self.by_kol = _positions_by(df_actual['KOL_ID'])
+        kols = df_actual.drop_duplicates('KOL_ID')[['KOL_ID', 'Name']]
+        self._kol_ids = kols['KOL_ID'].to_numpy()
+        self._kol_id_text = kols['KOL_ID'].astype(str).to_numpy(dtype=str)
+        self._kol_names = kols['Name'].astype(str).str.lower().to_numpy(dtype=str)
+        self._ranks = {}
+
+    @property
+    def areas(self):
+        return list(self.by_area)
+
+    def match_kols(self, text):
+        """KOL_IDs whose ID starts with, or whose name contains, text (case-insensitive)."""
+        text = text.strip().lower()
+        if not text: return self._kol_ids
+        hit = np.char.startswith(self._kol_id_text, text) | (np.char.find(self._kol_names, text) >= 0)
+        return self._kol_ids[hit]
+
+    def _rank(self, column):
+        # Rank of every row for column, computed once; NaN sorts last.
+        if column not in self._ranks:
+            values = normalize_activities(self.df)['Month_Num'] if column == 'Month' else self.df[column]
+            codes, _ = pd.factorize(values, sort=True)
+            self._ranks[column] = np.where(codes < 0, np.iinfo(np.int64).max, codes).astype(np.int64)
+        return self._ranks[column]
+
+    def positions(self, area=None, month=None, kol=None):
+        selected = None
+        def narrow(current, pos):
+            return pos if current is None else np.intersect1d(current, pos, assume_unique=True)
+        if area is not None: selected = narrow(selected, self.by_area.get(area, np.empty(0, dtype=np.int64)))
+        if month is not None: selected = narrow(selected, self.by_month.get(month, np.empty(0, dtype=np.int64)))
+        if kol:
+            kol_pos = [self.by_kol[k] for k in self.match_kols(kol) if k in self.by_kol]
+            selected = narrow(selected, np.sort(np.concatenate(kol_pos)) if kol_pos else np.empty(0, dtype=np.int64))
+        return np.arange(self.n_rows, dtype=np.int64) if selected is None else selected
+
+    def page(self, selected, sort_by=None, ascending=True, page=1, page_size=50):
+        if sort_by:
+            order = np.argsort(self._rank(sort_by)[selected], kind='stable')
+            if not ascending: order = order[::-1]
+            selected = selected[order]
+        start = max(page - 1, 0) * page_size
+        return self.df.iloc[selected[start:start + page_size]]
+
+    def query(self, area=None, month=None, kol=None, sort_by=None, ascending=True, page=1, page_size=50):
+        """(rows of the requested page, total matching rows)."""
+        selected = self.positions(area, month, kol)
+        return self.page(selected, sort_by, ascending, page, page_size), len(selected)
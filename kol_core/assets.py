@@ -0,0 +1,102 @@
+"""Fonts and logo served from static/assets instead of third-party hosts.
+
+`python -m kol_core.assets` downloads the files once, as part of a
+deployment. They are served by Streamlit's static file serving
+(server.enableStaticServing) at app/static/assets/<file>. Their URLs carry
+a ?v=<mtime> version, so kol_server.py can mark them cacheable for a year
+without serving a stale file after an update. Until a file has been
+downloaded, the page links to its original host (FONT_SOURCE, LOGO_SOURCE)
+instead, so it always shows the Inter font and the logo.
+
+    python -m kol_core.assets      download missing files into static/assets
+"""
+import argparse
+import os
+import sys
+import urllib.request
+
+from kol_core.profiles import STATIC_DIR_NAME
+
+ASSETS_SUBDIR = "assets"
+ASSETS_ROUTE = f"/app/{STATIC_DIR_NAME}/{ASSETS_SUBDIR}/"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+FONT_FAMILY = "Inter"
+FONT_STACK = f"'{FONT_FAMILY}', -apple-system, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif"
+# Download sources for fetch_assets, and the page's fallback while a file is missing.
+# {weight: file}; the latin subset covers the dashboard's text.
+FONT_FILES = {400: "inter-latin-400-normal.woff2", 600: "inter-latin-600-normal.woff2", 800: "inter-latin-800-normal.woff2"}
+FONT_SOURCE = "https://cdn.jsdelivr.net/npm/@fontsource/inter@5/files/"
+LOGO_FILE = "MEDIT_CI_Dark.png"
+LOGO_SOURCE = "https://medit-web-gcs.s3.ap-northeast-2.amazonaws.com/files/2023-01-31/0d273f0d-e461-4c6e-82f5-19e09d17208d/MEDIT_CI_Dark.png"
+
+def assets_dir(app_dir):
+    return os.path.join(app_dir, STATIC_DIR_NAME, ASSETS_SUBDIR)
+
+def asset_url(app_dir, filename):
+    """Versioned static URL of a bundled file, or None when it is not bundled."""
+    try:
+        mtime_ns = os.stat(os.path.join(assets_dir(app_dir), filename)).st_mtime_ns
+    except OSError:
+        return None
+    return f"app/{STATIC_DIR_NAME}/{ASSETS_SUBDIR}/{filename}?v={mtime_ns:x}"
+
+def font_face_css(app_dir):
+    """@font-face rules for every weight, bundled or remote; an installed Inter is used before either."""
+    rules = []
+    for weight, filename in FONT_FILES.items():
+        url = asset_url(app_dir, filename) or FONT_SOURCE + filename
+        rules.append(f"@font-face {{ font-family: '{FONT_FAMILY}'; font-style: normal; font-weight: {weight}; font-display: swap; "
+                     f"src: local('{FONT_FAMILY}'), url('{url}') format('woff2'); }}")
+    return "\n".join(rules)
+
+def logo_url(app_dir):
+    """Versioned URL of the downloaded logo, or LOGO_SOURCE when it is missing."""
+    return asset_url(app_dir, LOGO_FILE) or LOGO_SOURCE
+
+class StaticCacheMiddleware:
+    """ASGI middleware adding CACHE_CONTROL to responses for the bundled assets."""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or ASSETS_ROUTE not in scope["path"]:
+            return await self.app(scope, receive, send)
+
+        async def send_with_cache(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"cache-control"]
+                message = {**message, "headers": headers + [(b"cache-control", CACHE_CONTROL.encode("latin-1"))]}
+            await send(message)
+        return await self.app(scope, receive, send_with_cache)
+
+def fetch_assets(app_dir, force=False):
+    """Download the fonts and logo that are not bundled yet. Returns the files written."""
+    target = assets_dir(app_dir)
+    os.makedirs(target, exist_ok=True)
+    sources = {filename: FONT_SOURCE + filename for filename in FONT_FILES.values()}
+    sources[LOGO_FILE] = LOGO_SOURCE
+    written = []
+    for filename, url in sources.items():
+        path = os.path.join(target, filename)
+        if os.path.exists(path) and not force: continue
+        with urllib.request.urlopen(url, timeout=30) as response: data = response.read()
+        with open(path + ".tmp", "wb") as f: f.write(data)
+        os.replace(path + ".tmp", path)
+        written.append(filename)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download the dashboard's fonts and logo into static/assets.")
+    parser.add_argument("--app-dir", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--force", action="store_true", help="download files that are already present again")
+    args = parser.parse_args(argv)
+    try:
+        written = fetch_assets(args.app_dir, args.force)
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"{assets_dir(args.app_dir)}: {len(written)} downloaded" + (f" ({', '.join(written)})" if written else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Aggregated, size-capped data for the dashboard charts.
+
+Charts are fed aggregates, never tracking rows, so the Vega-Lite spec sent to
+the browser does not grow with the log. A series longer than MAX_CHART_ROWS is
+reduced on the server before it reaches a spec: numeric and date series are
+binned, categorical series keep their largest categories and fold the rest
+into "Other".
+"""
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import MONTH_LIST_SORTED
+from kol_core.normalize import normalize_activities
+
+MAX_CHART_ROWS = 500
+OTHER_LABEL = "Other"
+
+def monthly_volume(df_actual):
+    """Activity count per month in calendar order; months without activities are 0."""
+    month_num = normalize_activities(df_actual)['Month_Num']
+    counts = df_actual['Activity'].groupby(month_num).count().reindex(range(1, 13), fill_value=0)
+    return pd.DataFrame({'Month': MONTH_LIST_SORTED, 'Activity': counts.to_numpy()})
+
+def target_by_area(df_dashboard):
+    return df_dashboard.groupby('Area', observed=True)['Target_Count'].sum().reset_index()
+
+def status_counts(df_dashboard):
+    """Rows per Status, largest first; statuses with no rows are left out."""
+    counts = df_dashboard['Status'].value_counts()
+    counts = counts[counts > 0]
+    return pd.DataFrame({'Status': counts.index.astype(str), 'Count': counts.to_numpy()})
+
+def cap_rows(data, x, y, max_rows=MAX_CHART_ROWS, agg='sum'):
+    """data[[x, y]] reduced to at most max_rows rows.
+
+    Numeric and date x values are split into max_rows equal-width bins, each
+    labelled by its smallest x; other x values keep the max_rows - 1 largest
+    by y plus one OTHER_LABEL row for the rest.
+    """
+    data = data[[x, y]]
+    if len(data) <= max_rows: return data
+    values = data[x]
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+        bins = pd.cut(values, max_rows, labels=False)
+        return data.groupby(bins, sort=True).agg({x: 'min', y: agg}).reset_index(drop=True)
+    order = np.argsort(-data[y].to_numpy(), kind='stable')
+    head, rest = data.iloc[order[:max_rows - 1]], data.iloc[order[max_rows - 1:]]
+    other = pd.DataFrame({x: [OTHER_LABEL], y: [rest[y].agg(agg)]})
+    return pd.concat([head.astype({x: object}), other], ignore_index=True)
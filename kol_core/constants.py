@@ -0,0 +1,33 @@
+YEAR = 2025 
+
+MONTH_MAP = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "April": 4, "May": 5, "June": 6,
+    "July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12
+}
+MONTH_LIST_SORTED = list(MONTH_MAP.keys())
+
+WEEK_START_DAY = {
+    "1w": 1, "2w": 8, "3w": 15, "4w": 22, "5w": 29
+}
+
+ACTIVITY_TO_TASK_MAP = {
+    'Lecture': 'Lecture', 'offline lecture': 'Lecture', 'ADF Lecture': 'Lecture',
+    'Academy lectures': 'Lecture', 'Academy': 'Lecture',
+    'Hands-on course': 'Lecture', 'Hands on training': 'Lecture', 'Skill up Seminar': 'Lecture',
+    'case report': 'Case Report', 'Article case': 'Case Report', 'Clinical case report': 'Case Report',
+    'T-series case report': 'Case Report',
+    'Article': 'Article', 'Clinical Paper': 'Article',
+    'Webinar': 'Webinar', 'Testimonial': 'Testimonial',
+    'Contents creation': 'SNS Posting', 'ContentsCreation': 'SNS Posting',
+    'social activities': 'SNS Posting', 'Social engagement': 'SNS Posting', 'Social Media': 'SNS Posting'
+}
+
+TASKS = list(dict.fromkeys(ACTIVITY_TO_TASK_MAP.values()))
+
+STATUSES = ["Completed", "On Track", "Delayed", "Not Started", "N/A"]
+IN_PROGRESS_STATUSES = ["On Track", "Delayed"]
+
+EVENT_COLORS = {
+    'Lecture': '#2D5AF5', 'Case Report': '#00C4CC', 'SNS Posting': '#FF6B6B', 
+    'Article': '#FF9F43', 'Webinar': '#A3CB38', 'Testimonial': '#6C5CE7'
+}
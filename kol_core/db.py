@@ -0,0 +1,263 @@
+"""SQLite backend: ingestion CLI and indexed, pushed-down dashboard queries.
+
+    python -m kol_core.db --db kol.db --workbook "2025=(KOL) DATA_251117.xlsx"
+
+Workbooks are first synced into the partitioned store (same year semantics
+as the Feather backend), then the database is rebuilt next to the old one and
+swapped in atomically, so viewers never see a half-written file. Besides the
+cleaned contracts and tracking rows it materializes:
+
+    kol_master     one row per (Plan_Year, KOL_ID), as plan_master returns it
+    targets        Target_Count per (Plan_Year, KOL_ID, Task) with KOL columns
+    actual_counts  Actual_Count per (KOL_ID, Task, Year, Activity_Date)
+
+Dashboard reads only touch the materialized tables; tracking rows are read
+a page (Admin log) or a year (calendar) at a time.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+
+from kol_core.constants import MONTH_MAP
+from kol_core.excel import WorkbookError
+from kol_core.metrics import plan_master, dashboard_from_counts, pacing_trend_from_counts
+from kol_core.normalize import NORMALIZED_COLUMNS, normalize_activities, normalization_report
+from kol_core.schema import ACTUAL_SCHEMA, compact
+from kol_core.store import PartitionedStore
+
+DATE_FORMAT = "%Y-%m-%d"
+PLAN_DATE_COLUMNS = ['Contract Start', 'Contract End']
+MASTER_DATE_COLUMNS = ['Contract_Start', 'Contract_End']
+INDEXES = {
+    "contracts": [("Plan_Year", "KOL_ID"), ("Name",), ("Area",)],
+    "tracking": [("KOL_ID",), ("Name",), ("Area",), ("Month",), ("Activity_Date",), ("Year", "Month_Num")],
+    "kol_master": [("Plan_Year", "KOL_ID")],
+    "targets": [("Plan_Year", "KOL_ID", "Task")],
+    "actual_counts": [("KOL_ID", "Task", "Activity_Date"), ("Activity_Date",)],
+}
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+def _dates_to_text(df, columns):
+    return df.assign(**{c: df[c].dt.strftime(DATE_FORMAT) for c in columns if c in df})
+
+def _sql_columns(df):
+    # SQLite column names are case-insensitive; clean_frames adds lat/lon next
+    # to the sheet's own Lat/Lon, so keep only the normalized (last) one.
+    return df.loc[:, ~df.columns.str.lower().duplicated(keep='last')]
+
+def _dates_from_text(df, columns):
+    return df.assign(**{c: pd.to_datetime(df[c], format=DATE_FORMAT) for c in columns if c in df})
+
+# -----------------------------------------------------------------
+# Ingestion
+# -----------------------------------------------------------------
+
+def build_database(store, db_path):
+    """Rebuild db_path from everything in the store. Returns the new data version."""
+    contracts, masters, targets = [], [], []
+    for year in store.years():
+        df_plan, _ = store.load(year)
+        df_plan_master, kol_master = plan_master(df_plan, year)
+        contracts.append(df_plan.assign(Plan_Year=year))
+        masters.append(kol_master.assign(Plan_Year=year))
+        targets.append(df_plan_master.assign(Plan_Year=year))
+    df_tracking = store.read_tracking()
+    if not contracts or df_tracking is None:
+        raise ValueError("the store holds no contract or tracking rows")
+    # Normalized at ingest; rows with no valid date or task keep NULLs.
+    df_tracking = normalize_activities(df_tracking.reset_index(drop=True))
+    df_counts = (df_tracking.dropna(subset=['Task', 'KOL_ID', 'Activity_Date'])
+                 .groupby(['KOL_ID', 'Task', 'Year', 'Activity_Date'], as_index=False, observed=True).size()
+                 .rename(columns={'size': 'Actual_Count'}))
+    tables = {
+        "contracts": _dates_to_text(pd.concat(contracts, ignore_index=True), PLAN_DATE_COLUMNS),
+        "tracking": _dates_to_text(df_tracking, ['Activity_Date']),
+        "kol_master": _dates_to_text(pd.concat(masters, ignore_index=True), MASTER_DATE_COLUMNS),
+        "targets": _dates_to_text(pd.concat(targets, ignore_index=True), MASTER_DATE_COLUMNS),
+        "actual_counts": _dates_to_text(df_counts, ['Activity_Date']),
+    }
+    version = hashlib.sha256(json.dumps(sorted(s["token"] for s in store.manifest["sources"].values())).encode("utf-8")).hexdigest()
+    meta = {
+        "version": version,
+        "tracking_columns": json.dumps([c for c in df_tracking.columns if c not in NORMALIZED_COLUMNS]),
+    }
+
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path): os.remove(tmp_path)
+    with sqlite3.connect(tmp_path) as conn:
+        for name, df in tables.items():
+            _sql_columns(df).to_sql(name, conn, index=False)
+            for columns in INDEXES[name]:
+                conn.execute(f"CREATE INDEX {_quote('ix_' + name + '_' + '_'.join(columns))} ON {name} ({', '.join(map(_quote, columns))})")
+        pd.DataFrame(list(meta.items()), columns=['key', 'value']).to_sql("meta", conn, index=False)
+        conn.execute("ANALYZE")
+    conn.close()
+    os.replace(tmp_path, db_path)
+    return version
+
+def workbook_arg(value):
+    year, sep, path = value.partition("=")
+    if not sep or not year.strip().isdigit():
+        raise argparse.ArgumentTypeError("expected YEAR=PATH")
+    return int(year), path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default="kol.db", help="SQLite database to (re)build")
+    parser.add_argument("--workbook", type=workbook_arg, action="append", default=[], metavar="YEAR=PATH",
+                        help="workbook whose tracking sheet covers YEAR; repeatable")
+    parser.add_argument("--contract-tab", default="contracts")
+    parser.add_argument("--tracking-tab", default="tracking")
+    parser.add_argument("--store", default="data_store", help="partitioned store the workbooks are synced into")
+    args = parser.parse_args(argv)
+
+    store = PartitionedStore(args.store)
+    for year, path in args.workbook:
+        try:
+            changed = store.sync_workbook(path, args.contract_tab, args.tracking_tab, year)
+        except WorkbookError as e:
+            print(e.report(), file=sys.stderr)
+            return 1
+        print(f"{year}: {path} {'ingested' if changed else 'unchanged'}")
+    try:
+        version = build_database(store, args.db)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"wrote {args.db} (version {version[:12]})")
+    return 0
+
+# -----------------------------------------------------------------
+# Queries
+# -----------------------------------------------------------------
+
+class SQLiteBackend:
+    """Read-only queries against a database written by build_database.
+
+    A connection is opened per call, so one instance can be shared by every
+    session and thread.
+    """
+    def __init__(self, db_path):
+        self.db_path = os.path.abspath(db_path)
+        self._meta = None
+
+    def _connect(self):
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+
+    def _read(self, sql, params=()):
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+        conn.close()
+        return df
+
+    def _scalar(self, sql, params=()):
+        with self._connect() as conn:
+            value = conn.execute(sql, params).fetchone()[0]
+        conn.close()
+        return value
+
+    @property
+    def meta(self):
+        mtime_ns = os.stat(self.db_path).st_mtime_ns
+        if self._meta is None or self._meta[0] != mtime_ns:
+            self._meta = (mtime_ns, dict(self._read("SELECT key, value FROM meta").itertuples(index=False)))
+        return self._meta[1]
+
+    def years(self):
+        return self._read("SELECT DISTINCT Plan_Year FROM kol_master ORDER BY Plan_Year DESC")['Plan_Year'].tolist()
+
+    def version(self, year):
+        return f"{self.meta['version']}:{year}"
+
+    @property
+    def tracking_columns(self):
+        return json.loads(self.meta["tracking_columns"])
+
+    # --- dashboard --------------------------------------------------------
+    def _plan_master(self, year):
+        df_plan_master = self._read("SELECT * FROM targets WHERE Plan_Year = ? ORDER BY rowid", (year,)).drop(columns='Plan_Year')
+        return _dates_from_text(df_plan_master, MASTER_DATE_COLUMNS)
+
+    def kol_master(self, year):
+        df = self._read("SELECT * FROM kol_master WHERE Plan_Year = ? ORDER BY rowid", (year,)).drop(columns='Plan_Year')
+        return _dates_from_text(df, MASTER_DATE_COLUMNS)
+
+    def _counts(self, year, through, group_dates):
+        # Earlier years' activities count only toward contracts that had already
+        # started, mirroring PartitionedStore.load.
+        date_col = ", c.Activity_Date" if group_dates else ""
+        sql = f"""
+            SELECT c.KOL_ID, c.Task{date_col}, SUM(c.Actual_Count) AS Actual_Count
+            FROM actual_counts c JOIN kol_master k ON k.Plan_Year = ? AND k.KOL_ID = c.KOL_ID
+            WHERE c.Activity_Date <= ? AND (c.Year = ? OR c.Year >= CAST(strftime('%Y', k.Contract_Start) AS INTEGER))
+            GROUP BY c.KOL_ID, c.Task{date_col}
+        """
+        params = [year, through.strftime(DATE_FORMAT), year]
+        return _dates_from_text(self._read(sql, params), ['Activity_Date'])
+
+    def dashboard(self, today):
+        """(df_dashboard, kol_master) as of today, matching compute_dashboard."""
+        report_date = pd.Timestamp(today)
+        df_counts = self._counts(report_date.year, report_date, False)
+        df_dashboard = dashboard_from_counts(self._plan_master(report_date.year), df_counts, report_date)
+        return df_dashboard, self.kol_master(report_date.year)
+
+    def pacing_trend(self, as_of_dates):
+        as_of = pd.DatetimeIndex(sorted(as_of_dates))
+        year = as_of[-1].year
+        return pacing_trend_from_counts(self._plan_master(year), self._counts(year, as_of[-1], True), as_of)
+
+    # --- tracking ---------------------------------------------------------
+    def activities(self, year):
+        columns = ", ".join(map(_quote, self.tracking_columns))
+        return compact(self._read(f"SELECT {columns} FROM tracking WHERE Year = ? ORDER BY rowid", (year,)), ACTUAL_SCHEMA)
+
+    def normalization_report(self, year):
+        """normalization_report for the year's tracking rows; only rows missing a date or task are read."""
+        df = self._read("SELECT * FROM tracking WHERE Year = ? AND (Activity_Date IS NULL OR Task IS NULL) ORDER BY rowid", (year,))
+        return normalization_report(_dates_from_text(df, ['Activity_Date']))
+
+    def areas(self, year):
+        return self._read("SELECT DISTINCT Area FROM tracking WHERE Year = ? AND Area IS NOT NULL ORDER BY Area", (year,))['Area'].tolist()
+
+    def _log_filter(self, year, area, month, kol):
+        where, params = ["Year = ?"], [year]
+        if area is not None: where.append("Area = ?"); params.append(area)
+        if month is not None: where.append("Month_Num = ?"); params.append(MONTH_MAP[month])
+        if kol and kol.strip():
+            # Same matching as ActivityLogIndex.match_kols: ID prefix or name substring.
+            text = kol.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            where.append("(CAST(KOL_ID AS TEXT) LIKE ? ESCAPE '\\' OR lower(Name) LIKE ? ESCAPE '\\')")
+            params += [text + "%", "%" + text + "%"]
+        return " AND ".join(where), params
+
+    def activity_log_count(self, year, area=None, month=None, kol=None):
+        where_sql, params = self._log_filter(year, area, month, kol)
+        return self._scalar(f"SELECT COUNT(*) FROM tracking WHERE {where_sql}", params)
+
+    def activity_log_page(self, year, area=None, month=None, kol=None, sort_by=None, ascending=True, page=1, page_size=50):
+        where_sql, params = self._log_filter(year, area, month, kol)
+        order_sql = "rowid"
+        if sort_by:
+            column = _quote("Month_Num" if sort_by == "Month" else sort_by)
+            direction = "ASC" if ascending else "DESC"
+            # NULLs last for ascending, first for descending, like ActivityLogIndex.
+            order_sql = f"{column} IS NULL {direction}, {column} {direction}, rowid {direction}"
+        columns = ", ".join(map(_quote, self.tracking_columns))
+        offset = max(page - 1, 0) * page_size
+        return self._read(f"SELECT {columns} FROM tracking WHERE {where_sql} ORDER BY {order_sql} LIMIT ? OFFSET ?", params + [page_size, offset])
+
+    def activity_log(self, year, area=None, month=None, kol=None, sort_by=None, ascending=True, page=1, page_size=50):
+        """(rows of the requested page, total matching rows), filtered and sorted in SQL."""
+        return (self.activity_log_page(year, area, month, kol, sort_by, ascending, page, page_size),
+                self.activity_log_count(year, area, month, kol))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Streaming, column-projected reading of the contract and tracking sheets.
+
+Each sheet is read with openpyxl in read-only mode, one row at a time. Only
+the columns the dashboard uses are kept, and rows are typed in chunks of
+CHUNK_ROWS (numbers, dates, categoricals) as they are read, so peak memory
+follows the kept columns rather than the whole sheet. Large workbooks have
+their two sheets parsed in separate processes.
+
+Problems that would make the data wrong (a missing sheet or column, a KOL_ID
+that is not a number, a contract date that cannot be parsed) are collected
+for both sheets and raised together as one WorkbookError.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+CHUNK_ROWS = 50_000
+# Below this size, starting worker processes costs more than it saves.
+PARALLEL_MIN_BYTES = 4 * 2**20
+MAX_REPORTED_ROWS = 10
+# Cell text read as missing, as pd.read_excel does by default.
+NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+})
+
+# {column: kind}; kind is "id", "number", "date" or "text".
+PLAN_COLUMNS = {
+    'KOL_ID': 'id', 'Name': 'text', 'Area': 'text', 'Country': 'text',
+    'Contract Start': 'date', 'Contract End': 'date', 'Task': 'text', 'Frequency': 'number',
+    'lat': 'number', 'Lat': 'number', 'Latitude': 'number', 'lon': 'number', 'Lon': 'number', 'Longitude': 'number'
+}
+PLAN_REQUIRED = ['KOL_ID', 'Name', 'Area', 'Country', 'Contract Start', 'Contract End', 'Task', 'Frequency']
+# The Admin Activity Log shows the tracking sheet's own columns, Count included.
+ACTUAL_COLUMNS = {
+    'KOL_ID': 'id', 'Name': 'text', 'Area': 'text', 'Country': 'text', 'Year': 'number',
+    'Quarter': 'text', 'Month': 'text', 'Week': 'text', 'Activity': 'text', 'Count': 'number'
+}
+ACTUAL_REQUIRED = ['KOL_ID', 'Name', 'Area', 'Month', 'Week', 'Activity']
+
+class WorkbookError(ValueError):
+    """The workbook cannot be loaded; problems lists every reason found."""
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = list(problems)
+        super().__init__(f"{os.path.basename(path)}: " + "; ".join(self.problems))
+
+    def report(self):
+        return "\n".join([f"Could not load {self.path}:"] + [f"- {problem}" for problem in self.problems])
+
+def _cell(value):
+    if isinstance(value, str):
+        return None if value in NA_STRINGS else value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def _rows_text(rows):
+    shown = ", ".join(str(r) for r in rows[:MAX_REPORTED_ROWS])
+    return shown + (f" and {len(rows) - MAX_REPORTED_ROWS} more" if len(rows) > MAX_REPORTED_ROWS else "")
+
+class _SheetParser:
+    """Accumulates projected rows of one sheet and types them a chunk at a time."""
+    def __init__(self, sheet_name, header, columns):
+        self.sheet_name = sheet_name
+        positions = {}
+        for pos, name in enumerate(header):
+            if isinstance(name, str) and name in columns and name not in positions: positions[name] = pos
+        self.columns = [c for c in columns if c in positions]
+        self.kinds = [columns[c] for c in self.columns]
+        self.positions = [positions[c] for c in self.columns]
+        self.chunks = []
+        self.bad_rows = {}
+        self._values = [[] for _ in self.columns]
+        self._excel_rows = []
+
+    def add(self, excel_row, row):
+        values = [_cell(row[pos]) if pos < len(row) else None for pos in self.positions]
+        if all(v is None for v in values): return
+        for column_values, value in zip(self._values, values): column_values.append(value)
+        self._excel_rows.append(excel_row)
+        if len(self._excel_rows) >= CHUNK_ROWS: self.flush()
+
+    def _problem(self, column, message, excel_rows):
+        self.bad_rows.setdefault((column, message), []).extend(excel_rows)
+
+    def flush(self):
+        if not self._excel_rows: return
+        excel_rows = np.asarray(self._excel_rows)
+        data = {}
+        for column, kind, values in zip(self.columns, self.kinds, self._values):
+            raw = pd.Series(values, dtype=object)
+            if kind == 'text':
+                data[column] = pd.Categorical(raw)
+                continue
+            if kind == 'date':
+                typed = pd.to_datetime(raw, errors='coerce')
+                invalid = typed.isna() & raw.notna()
+                if invalid.any(): self._problem(column, "is not a date", excel_rows[invalid.to_numpy()].tolist())
+            else:
+                typed = pd.to_numeric(raw, errors='coerce')
+                invalid = typed.isna() & raw.notna()
+                if kind == 'id' and invalid.any(): self._problem(column, "is not a number", excel_rows[invalid.to_numpy()].tolist())
+            data[column] = typed.to_numpy()
+        self.chunks.append(pd.DataFrame(data, columns=self.columns))
+        self._values = [[] for _ in self.columns]
+        self._excel_rows = []
+
+    def frame(self):
+        self.flush()
+        if not self.chunks: return pd.DataFrame({c: pd.Series(dtype=object) for c in self.columns})
+        if len(self.chunks) == 1: return self.chunks[0]
+        # Categoricals are merged on their categories so the result never
+        # passes through an object column the size of the sheet.
+        data = {}
+        for column in self.columns:
+            parts = [chunk[column] for chunk in self.chunks]
+            if isinstance(parts[0].dtype, pd.CategoricalDtype):
+                data[column] = union_categoricals([p.array for p in parts])
+            else:
+                data[column] = np.concatenate([p.to_numpy() for p in parts])
+        return pd.DataFrame(data, columns=self.columns)
+
+    def problems(self):
+        return [f"sheet '{self.sheet_name}', column '{column}' {message} in row(s) {_rows_text(rows)}"
+                for (column, message), rows in self.bad_rows.items()]
+
+def parse_sheet(excel_file_path, sheet_name, columns, required):
+    """(frame, problems) for one sheet, keeping only the given columns."""
+    from openpyxl import load_workbook
+    try:
+        workbook = load_workbook(excel_file_path, read_only=True, data_only=True, keep_links=False)
+    except Exception as e:
+        return None, [f"cannot open the workbook: {type(e).__name__}: {e}"]
+    try:
+        if sheet_name not in workbook.sheetnames:
+            return None, [f"sheet '{sheet_name}' not found (sheets: {', '.join(workbook.sheetnames)})"]
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        parser = _SheetParser(sheet_name, header, columns)
+        missing = [c for c in required if c not in parser.columns]
+        if missing:
+            found = [str(h) for h in header if h is not None]
+            return None, [f"sheet '{sheet_name}' is missing column(s) {', '.join(repr(c) for c in missing)} (found: {', '.join(found) or 'no header'})"]
+        for excel_row, row in enumerate(rows, start=2):
+            parser.add(excel_row, row)
+        return parser.frame(), parser.problems()
+    finally:
+        workbook.close()
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    # Never fork the (multi-threaded) server process itself.
+    if "forkserver" in methods:
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["kol_core.excel"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+def read_sheets(excel_file_path, contract_tab, tracking_tab, parallel=None):
+    """Raw (df_plan, df_actual) with only the dashboard's columns, typed per column.
+
+    parallel defaults to True for workbooks of PARALLEL_MIN_BYTES or more.
+    Raises WorkbookError listing the problems found in either sheet.
+    """
+    jobs = [(excel_file_path, contract_tab, PLAN_COLUMNS, PLAN_REQUIRED),
+            (excel_file_path, tracking_tab, ACTUAL_COLUMNS, ACTUAL_REQUIRED)]
+    if parallel is None: parallel = os.path.getsize(excel_file_path) >= PARALLEL_MIN_BYTES
+    results = None
+    if parallel:
+        try:
+            with ProcessPoolExecutor(max_workers=len(jobs), mp_context=_pool_context()) as pool:
+                results = [f.result() for f in [pool.submit(parse_sheet, *job) for job in jobs]]
+        except (OSError, BrokenProcessPool, NotImplementedError):
+            results = None
+    if results is None:
+        results = [parse_sheet(*job) for job in jobs]
+    # An unreadable workbook is reported by both sheets; list it once.
+    problems = list(dict.fromkeys(problem for _, sheet_problems in results for problem in sheet_problems))
+    if problems: raise WorkbookError(excel_file_path, problems)
+    return results[0][0], results[1][0]
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+CACHE_DIR_NAME = ".kol_cache"
+MANIFEST_NAME = "manifest.json"
+HASH_CHUNK = 1 << 20
+
+def cache_dir_for(workbook_path):
+    return os.path.join(os.path.dirname(os.path.abspath(workbook_path)), CACHE_DIR_NAME)
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("workbooks", {})
+    manifest.setdefault("frames", {})
+    return manifest
+
+def _write_manifest(cache_dir, manifest):
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = os.path.join(cache_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(cache_dir, MANIFEST_NAME))
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def workbook_fingerprint(workbook_path):
+    """Return {path, size, mtime_ns, sha256} for the workbook.
+
+    The content hash is only recomputed when size or mtime differ from the
+    manifest entry, so an unchanged file costs a single stat().
+    """
+    path = os.path.abspath(workbook_path)
+    st_res = os.stat(path)
+    cache_dir = cache_dir_for(path)
+    manifest = _read_manifest(cache_dir)
+    entry = manifest["workbooks"].get(path)
+    if entry and entry["size"] == st_res.st_size and entry["mtime_ns"] == st_res.st_mtime_ns:
+        return entry
+    entry = {"path": path, "size": st_res.st_size, "mtime_ns": st_res.st_mtime_ns, "sha256": _sha256(path)}
+    manifest["workbooks"][path] = entry
+    try:
+        _write_manifest(cache_dir, manifest)
+    except OSError:
+        pass
+    return entry
+
+def _frame_paths(fingerprint, *parts):
+    key = hashlib.sha256("|".join([fingerprint["path"], fingerprint["sha256"], *parts]).encode("utf-8")).hexdigest()[:20]
+    base = os.path.join(cache_dir_for(fingerprint["path"]), key)
+    return base + ".plan.feather", base + ".actual.feather"
+
+def read_cached_frames(fingerprint, *parts):
+    """Memory-map the cached (df_plan, df_actual) for this workbook version, or None."""
+    if feather is None: return None
+    plan_path, actual_path = _frame_paths(fingerprint, *parts)
+    if not (os.path.exists(plan_path) and os.path.exists(actual_path)): return None
+    try:
+        df_plan = feather.read_table(plan_path, memory_map=True).to_pandas()
+        df_actual = feather.read_table(actual_path, memory_map=True).to_pandas()
+    except (OSError, ValueError, TypeError):
+        return None
+    return df_plan, df_actual
+
+def write_cached_frames(fingerprint, df_plan, df_actual, *parts):
+    """Persist cleaned frames; stale entries for the same workbook path are removed."""
+    if feather is None: return False
+    plan_path, actual_path = _frame_paths(fingerprint, *parts)
+    cache_dir = os.path.dirname(plan_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for df, path in ((df_plan, plan_path), (df_actual, actual_path)):
+            tmp_path = path + ".tmp"
+            feather.write_feather(df.reset_index(drop=True), tmp_path, compression="uncompressed")
+            os.replace(tmp_path, path)
+    except (OSError, ValueError, TypeError):
+        return False
+    _prune(cache_dir, fingerprint["path"], {os.path.basename(plan_path), os.path.basename(actual_path)})
+    return True
+
+def _prune(cache_dir, workbook_path, keep):
+    manifest = _read_manifest(cache_dir)
+    owners = manifest["frames"]
+    for name in keep: owners[name] = workbook_path
+    for name, owner in list(owners.items()):
+        if owner == workbook_path and name not in keep:
+            try: os.remove(os.path.join(cache_dir, name))
+            except OSError: pass
+            owners.pop(name)
+    try:
+        _write_manifest(cache_dir, manifest)
+    except OSError:
+        pass
@@ -0,0 +1,92 @@
+"""Grid clustering of KOL locations for the activity map.
+
+Points are bucketed into square lat/lon cells whose size halves with each zoom
+level, roughly CELLS_PER_TILE cells across one 256px map tile. Buckets for all
+zoom levels are computed once per data version; at render time only the
+clusters inside the viewport are sent, and individual markers only for the
+clusters that are visible at a zoom where they can be told apart.
+"""
+import numpy as np
+import pandas as pd
+
+CELLS_PER_TILE = 4
+MAX_CLUSTER_ZOOM = 12
+POINT_COLUMNS = ['KOL_ID', 'Name', 'Country', 'Area', 'lat', 'lon']
+
+def cell_size(zoom, cells_per_tile=CELLS_PER_TILE):
+    return 360.0 / (2 ** zoom) / cells_per_tile
+
+def assign_cells(df_points, zoom, cells_per_tile=CELLS_PER_TILE):
+    size = cell_size(zoom, cells_per_tile)
+    cell_x = np.floor((df_points['lon'].to_numpy() + 180.0) / size).astype(np.int64)
+    cell_y = np.floor((df_points['lat'].to_numpy() + 90.0) / size).astype(np.int64)
+    return cell_x, cell_y
+
+def map_points(kol_master):
+    return kol_master.dropna(subset=['lat', 'lon'])[POINT_COLUMNS].reset_index(drop=True)
+
+def cluster_points(df_points, zoom, cells_per_tile=CELLS_PER_TILE):
+    """One row per occupied cell: centroid, member count and bounding box."""
+    cell_x, cell_y = assign_cells(df_points, zoom, cells_per_tile)
+    df = df_points.assign(cell_x=cell_x, cell_y=cell_y)
+    clusters = df.groupby(['cell_x', 'cell_y'], sort=False).agg(
+        count=('KOL_ID', 'size'), lat=('lat', 'mean'), lon=('lon', 'mean'),
+        lat_min=('lat', 'min'), lat_max=('lat', 'max'), lon_min=('lon', 'min'), lon_max=('lon', 'max'),
+        Name=('Name', 'first'), Country=('Country', 'first')
+    ).reset_index()
+    clusters['zoom'] = zoom
+    return clusters
+
+def precompute_clusters(df_points, zooms=range(0, MAX_CLUSTER_ZOOM + 1), cells_per_tile=CELLS_PER_TILE):
+    return {zoom: cluster_points(df_points, zoom, cells_per_tile) for zoom in zooms}
+
+def _normalize_lon(lon):
+    return ((lon + 180.0) % 360.0) - 180.0
+
+def _lon_ranges(west, east):
+    if east - west >= 360: return [(-180.0, 180.0)]
+    west, east = _normalize_lon(west), _normalize_lon(east)
+    return [(west, east)] if west <= east else [(west, 180.0), (-180.0, east)]
+
+def in_bounds(lat, lon, bounds):
+    """Mask of points inside (south, west, north, east); handles views crossing the antimeridian."""
+    if bounds is None: return np.ones(len(lat), dtype=bool)
+    south, west, north, east = bounds
+    lon_ok = np.zeros(len(lon), dtype=bool)
+    for lo, hi in _lon_ranges(west, east):
+        lon_ok |= (lon >= lo) & (lon <= hi)
+    return (lat >= south) & (lat <= north) & lon_ok
+
+def visible_clusters(clusters, bounds):
+    # A cluster is visible when its bounding box intersects the view.
+    if bounds is None: return clusters
+    south, west, north, east = bounds
+    lon_ok = np.zeros(len(clusters), dtype=bool)
+    for lo, hi in _lon_ranges(west, east):
+        lon_ok |= (clusters['lon_max'].to_numpy() >= lo) & (clusters['lon_min'].to_numpy() <= hi)
+    return clusters[(clusters['lat_max'].to_numpy() >= south) & (clusters['lat_min'].to_numpy() <= north) & lon_ok]
+
+def cluster_members(df_points, clusters, cells_per_tile=CELLS_PER_TILE):
+    """Individual points belonging to the given clusters (all at the same zoom)."""
+    if clusters.empty: return df_points.iloc[0:0]
+    zoom = int(clusters['zoom'].iloc[0])
+    cell_x, cell_y = assign_cells(df_points, zoom, cells_per_tile)
+    point_keys = pd.MultiIndex.from_arrays([cell_x, cell_y])
+    wanted = pd.MultiIndex.from_frame(clusters[['cell_x', 'cell_y']])
+    return df_points[point_keys.isin(wanted)]
+
+def view_layers(df_points, clusters_by_zoom, zoom, bounds, max_markers=500):
+    """(clusters, markers) to draw for a viewport.
+
+    Above MAX_CLUSTER_ZOOM, or when the visible clusters hold few enough KOLs,
+    their members are returned as individual markers instead.
+    """
+    zoom = int(min(max(zoom, 0), max(clusters_by_zoom)))
+    clusters = visible_clusters(clusters_by_zoom[zoom], bounds)
+    if zoom >= MAX_CLUSTER_ZOOM or clusters['count'].sum() <= max_markers:
+        singles = clusters
+        clusters = clusters.iloc[0:0]
+    else:
+        singles = clusters[clusters['count'] == 1]
+        clusters = clusters[clusters['count'] > 1]
+    return clusters, cluster_members(df_points, singles)
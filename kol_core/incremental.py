@@ -0,0 +1,120 @@
+"""Incremental Actual_Count maintenance for an append-only tracking log.
+
+The engine keeps per-(KOL_ID, Task, Activity_Date) activity counts. When the
+tracking frame it is given starts with the rows it has already seen, only the
+appended rows are parsed and folded into the counts, and cached as-of-date
+snapshots are patched for the KOL x Task rows the new activities touch.
+Anything else (plan edits, shrunk or rewritten history) triggers a rebuild.
+
+Seen rows are recognized by a 64-bit hash per row, kept from the previous
+update and compared against the new frame's leading rows, so an edit to any
+earlier row is caught, not only to the rows a sample happens to cover.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import YEAR
+from kol_core.metrics import plan_master, activity_dates, dashboard_from_counts, refresh_kpis
+
+def row_hashes(df):
+    """uint64 hash of every row's values, independent of the index."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+def _frame_hash(df):
+    return hashlib.sha1(row_hashes(df).tobytes()).hexdigest()
+
+class IncrementalDashboard:
+    def __init__(self, year=YEAR, max_snapshots=24):
+        self.year = year
+        self.max_snapshots = max_snapshots
+        self._lock = threading.RLock()
+        self._plan_hash = None
+        self._plan_master = None
+        self._kol_master = None
+        self.last_update = {"mode": None, "rows": 0}
+        self._reset_actuals()
+
+    def _reset_actuals(self):
+        self._watermark = 0
+        self._row_hashes = None
+        self._chunks = []
+        self._counts = None
+        self._snapshots = OrderedDict()
+
+    def update(self, df_plan, df_actual):
+        with self._lock:
+            plan_hash = _frame_hash(df_plan)
+            if plan_hash != self._plan_hash:
+                self._plan_hash = plan_hash
+                self._plan_master, self._kol_master = plan_master(df_plan, self.year)
+                self._reset_actuals()
+            
+            n_rows = len(df_actual)
+            hashes = row_hashes(df_actual)
+            appended = self._row_hashes is not None and n_rows >= self._watermark and np.array_equal(hashes[:self._watermark], self._row_hashes)
+            if not appended:
+                self._reset_actuals()
+                self._apply(df_actual)
+                self.last_update = {"mode": "full", "rows": n_rows}
+            elif n_rows > self._watermark:
+                delta_rows = n_rows - self._watermark
+                self._apply(df_actual.iloc[self._watermark:])
+                self.last_update = {"mode": "delta", "rows": delta_rows}
+            else:
+                self.last_update = {"mode": "unchanged", "rows": 0}
+            self._watermark = n_rows
+            self._row_hashes = hashes
+        return self
+
+    def _apply(self, df_rows):
+        df_acts = activity_dates(df_rows, self.year)
+        self._chunks.append(df_acts)
+        df_counted = df_acts.dropna(subset=['Task', 'KOL_ID'])
+        delta = df_counted.groupby(['KOL_ID', 'Task', 'Activity_Date'], observed=True).size()
+        self._counts = delta if self._counts is None else self._counts.add(delta, fill_value=0).astype('int64')
+        for report_date in list(self._snapshots):
+            self._snapshots[report_date] = self._patch_snapshot(self._snapshots[report_date], df_counted, report_date)
+
+    def _patch_snapshot(self, df_dashboard, df_counted, report_date):
+        increments = df_counted[df_counted['Activity_Date'] <= report_date].groupby(['KOL_ID', 'Task'], observed=True).size()
+        if increments.empty: return df_dashboard
+        row_keys = pd.MultiIndex.from_frame(df_dashboard[['KOL_ID', 'Task']])
+        positions = row_keys.get_indexer(increments.index)
+        hit = positions >= 0
+        if not hit.any(): return df_dashboard
+        # Snapshots may already have been handed out, so patch a copy.
+        df_dashboard = df_dashboard.copy()
+        positions = positions[hit]
+        col = df_dashboard.columns.get_loc('Actual_Count')
+        actual = df_dashboard['Actual_Count'].to_numpy()
+        df_dashboard.iloc[positions, col] = (actual[positions] + increments.to_numpy()[hit]).astype(actual.dtype)
+        return refresh_kpis(df_dashboard, positions)
+
+    def _activities(self):
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks)]
+        return self._chunks[0]
+
+    def dashboard(self, today):
+        """(df_dashboard, df_actual_to_date, kol_master), matching compute_dashboard."""
+        with self._lock:
+            if self._plan_master is None:
+                raise RuntimeError("update() must be called before dashboard()")
+            report_date = pd.Timestamp(today)
+            df_dashboard = self._snapshots.get(report_date)
+            if df_dashboard is None:
+                counts = self._counts[self._counts.index.get_level_values('Activity_Date') <= report_date]
+                df_actual_counts = counts.groupby(level=['KOL_ID', 'Task'], observed=True).sum().rename('Actual_Count').reset_index()
+                df_dashboard = dashboard_from_counts(self._plan_master, df_actual_counts, report_date)
+                self._snapshots[report_date] = df_dashboard
+                while len(self._snapshots) > self.max_snapshots:
+                    self._snapshots.popitem(last=False)
+            else:
+                self._snapshots.move_to_end(report_date)
+            df_acts = self._activities()
+            df_actual_to_date = df_acts[df_acts['Activity_Date'] <= report_date]
+            return df_dashboard, df_actual_to_date, self._kol_master
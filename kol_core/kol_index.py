@@ -0,0 +1,101 @@
+"""Name/ID index and profile records for the sidebar KOL look-up.
+
+Built once per dashboard snapshot. Names are kept sorted so the selectbox
+needs no per-rerun sort, a KOL's record is a dict lookup, and search answers
+name, word and ID prefixes by bisection before falling back to trigram
+similarity for misspelt queries.
+"""
+import bisect
+import re
+from collections import Counter
+
+import numpy as np
+
+from kol_core.profiles import profile_filename
+
+PROFILE_FIELDS = ['KOL_ID', 'Name', 'Country', 'Area', 'Contract_Start', 'Contract_End', 'Elapsed_%']
+TASK_COLUMNS = ['Task', 'Status', 'Pacing_Progress_%']
+MIN_SIMILARITY = 0.5
+_WORD = re.compile(r"[^\W_]+")
+
+def _trigrams(text):
+    # Per word, padded so word starts weigh more than word interiors.
+    grams = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class KolIndex:
+    def __init__(self, df_dashboard, catalog=None):
+        self.df = df_dashboard
+        positions = df_dashboard.groupby('Name', sort=True, observed=True).indices
+        self.names = list(positions)
+        self._positions = positions
+        first = df_dashboard.iloc[[pos[0] for pos in positions.values()]]
+        self._fields = dict(zip(self.names, first[PROFILE_FIELDS].to_dict('records')))
+        self._records = {}
+        catalog = catalog or {}
+        self._pdfs = {name: catalog.get(profile_filename(name), (None, None)) for name in self.names}
+
+        self._ids = sorted(zip(first['KOL_ID'].astype(str), self.names))
+        self._lower = [name.lower() for name in self.names]
+        self._full = sorted((key, i) for i, key in enumerate(self._lower))
+        self._name_words = [_WORD.findall(key) for key in self._lower]
+        self._words = sorted((word, i) for i, words in enumerate(self._name_words) for word in words)
+        self._grams = {}
+        self._gram_counts = np.zeros(len(self.names), dtype=np.int64)
+        for i, key in enumerate(self._lower):
+            grams = _trigrams(key)
+            self._gram_counts[i] = len(grams)
+            for gram in grams: self._grams.setdefault(gram, []).append(i)
+
+    def record(self, name):
+        """Profile fields, PDF location and task rows for a KOL name, or None."""
+        if name not in self._positions: return None
+        record = self._records.get(name)
+        if record is None:
+            pdf_path, pdf_url = self._pdfs[name]
+            tasks = self.df.iloc[self._positions[name]][TASK_COLUMNS].reset_index(drop=True)
+            record = self._records[name] = {**self._fields[name], "pdf_path": pdf_path, "pdf_url": pdf_url, "tasks": tasks}
+        return record
+
+    @staticmethod
+    def _prefix_hits(sorted_keys, prefix):
+        start = bisect.bisect_left(sorted_keys, (prefix,))
+        end = bisect.bisect_left(sorted_keys, (prefix + "\uffff",))
+        return [value for _, value in sorted_keys[start:end]]
+
+    def search(self, text, limit=50):
+        """Names matching text: ID, full-name and word prefixes first (in name order), then close misspellings."""
+        text = " ".join(text.lower().split())
+        if not text: return self.names[:limit]
+        if text.isdigit():
+            return sorted(set(self._prefix_hits(self._ids, text)))[:limit]
+        hits = set(self._prefix_hits(self._full, text))
+        words = _WORD.findall(text)
+        if words:
+            # Every query word must start some word of the name ("kim j" finds "Dr. Jisoo Kim");
+            # candidates come from the longest, most selective word.
+            candidates = self._prefix_hits(self._words, max(words, key=len))
+            hits.update(i for i in candidates if all(any(w.startswith(q) for w in self._name_words[i]) for q in words))
+        hits = sorted(hits)
+        results = [self.names[i] for i in hits[:limit]]
+        if len(results) < limit:
+            results += [self.names[i] for i in self._similar(text, hits, limit - len(results))]
+        return results
+
+    def _similar(self, text, exclude, limit):
+        exclude = set(exclude)
+        grams = _trigrams(text)
+        if not grams: return []
+        shared = Counter(i for gram in grams for i in self._grams.get(gram, ()))
+        scored = []
+        for i, n_shared in shared.items():
+            if i in exclude: continue
+            # Share of the query's trigrams found in the name, so a misspelt
+            # first or last name still scores well against a long full name.
+            coverage = n_shared / len(grams)
+            if coverage >= MIN_SIMILARITY:
+                scored.append((-coverage, -n_shared / (len(grams) + self._gram_counts[i] - n_shared), i))
+        return [i for *_, i in sorted(scored)[:limit]]
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from kol_core.excel import read_sheets
+from kol_core.frame_cache import workbook_fingerprint, read_cached_frames, write_cached_frames
+from kol_core.normalize import normalize_names
+from kol_core.schema import PLAN_SCHEMA, ACTUAL_SCHEMA, compact
+
+# Part of the Feather cache key and the store's source tokens, so frames from before a schema change are rebuilt.
+SCHEMA_VERSION = "schema-5"
+
+def _find_col(df, options):
+    for col in options:
+        if col in df.columns: return col
+    return None
+
+def clean_frames(df_plan, df_actual):
+    df_plan = df_plan.dropna(subset=['KOL_ID'])
+    df_actual = df_actual.dropna(subset=['KOL_ID'])
+    lat_col = _find_col(df_plan, ['lat', 'Lat', 'Latitude'])
+    lon_col = _find_col(df_plan, ['lon', 'Lon', 'Longitude'])
+    df_plan = df_plan.assign(**{
+        'KOL_ID': pd.to_numeric(df_plan['KOL_ID'], errors='coerce').astype(int),
+        'Contract Start': pd.to_datetime(df_plan['Contract Start']),
+        'Contract End': pd.to_datetime(df_plan['Contract End']),
+        'Frequency': pd.to_numeric(df_plan['Frequency'], errors='coerce'),
+        'lat': pd.to_numeric(df_plan[lat_col], errors='coerce') if lat_col and lon_col else np.nan,
+        'lon': pd.to_numeric(df_plan[lon_col], errors='coerce') if lat_col and lon_col else np.nan
+    })
+    df_actual = df_actual.assign(KOL_ID=pd.to_numeric(df_actual['KOL_ID'], errors='coerce').astype(int))
+    df_plan, df_actual = normalize_names(df_plan, df_actual)
+    return compact(df_plan, PLAN_SCHEMA), compact(df_actual, ACTUAL_SCHEMA)
+
+def read_workbook(excel_file_path, contract_tab, tracking_tab, parallel=None):
+    """Cleaned frames straight from the workbook; raises WorkbookError if it cannot be used."""
+    df_plan, df_actual = read_sheets(excel_file_path, contract_tab, tracking_tab, parallel)
+    return clean_frames(df_plan, df_actual)
+
+def load_frames(excel_file_path, contract_tab, tracking_tab):
+    """Cleaned (df_plan, df_actual), served from the Feather cache when the workbook is unchanged."""
+    fingerprint = workbook_fingerprint(excel_file_path)
+    cached = read_cached_frames(fingerprint, contract_tab, tracking_tab, SCHEMA_VERSION)
+    if cached is not None: return cached
+    df_plan, df_actual = read_workbook(excel_file_path, contract_tab, tracking_tab)
+    write_cached_frames(fingerprint, df_plan, df_actual, contract_tab, tracking_tab, SCHEMA_VERSION)
+    return df_plan, df_actual
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import YEAR, IN_PROGRESS_STATUSES
+from kol_core.normalize import normalize_activities
+from kol_core.schema import DASHBOARD_SCHEMA, compact
+
+def plan_master(df_plan, year=YEAR):
+    default_start = pd.to_datetime(f"{year}-01-01")
+    default_end = pd.to_datetime(f"{year}-12-31")
+    df_plan = df_plan.assign(**{
+        'Contract Start': df_plan['Contract Start'].fillna(default_start),
+        'Contract End': df_plan['Contract End'].fillna(default_end)
+    })
+    
+    kol_master = df_plan.groupby('KOL_ID').agg(
+        Name=('Name', 'first'), Area=('Area', 'first'), Country=('Country', 'first'), 
+        Contract_Start=('Contract Start', 'min'), Contract_End=('Contract End', 'max'), 
+        lat=('lat', 'first'), lon=('lon', 'first')
+    ).reset_index()
+    
+    df_plan_grouped = df_plan.dropna(subset=['KOL_ID', 'Task', 'Frequency']).groupby(['KOL_ID', 'Task'], as_index=False, observed=True)['Frequency'].sum().rename(columns={'Frequency': 'Target_Count'})
+    df_plan_grouped['Target_Count'] = df_plan_grouped['Target_Count'].astype(int)
+    df_plan_master = pd.merge(df_plan_grouped, kol_master, on='KOL_ID', how='left')
+    return df_plan_master, kol_master
+
+def activity_dates(df_actual, year=YEAR):
+    """The rows of df_actual that have an Activity_Date, with the normalized columns.
+
+    Frames from the store are normalized at ingest, so this is only a filter;
+    anything else (a bare tracking sheet) is normalized here first.
+    """
+    df_actual_proc = normalize_activities(df_actual, year)
+    dated = df_actual_proc['Activity_Date'].notna()
+    return df_actual_proc if dated.all() else df_actual_proc[dated]
+
+def kpi_arrays(target, actual, elapsed_pct):
+    """Expected_Count, Pacing_Progress_%, Achievement_% and Status as arrays.
+
+    Inputs broadcast, so the same code serves a single as-of date (1-D) and a
+    KOL x Task by as-of date grid (2-D).
+    """
+    target, actual, elapsed_pct = np.broadcast_arrays(np.asarray(target), np.asarray(actual), np.asarray(elapsed_pct, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        achievement = np.where(target != 0, (actual / target) * 100, 0.0)
+        expected = target * (elapsed_pct / 100.0)
+        pacing = np.where(expected > 0, (actual / expected) * 100.0, np.where((expected == 0) & (actual > 0), 100.0, 0.0))
+    status = np.select(
+        [achievement >= 100, target == 0, (elapsed_pct == 0) & (actual == 0), pacing >= 100],
+        ["Completed", "N/A", "Not Started", "On Track"], default="Delayed"
+    )
+    return expected, pacing, achievement, status
+
+def dashboard_from_counts(df_plan_master, df_actual_counts, report_date):
+    df_dashboard = pd.merge(df_plan_master, df_actual_counts, on=['KOL_ID', 'Task'], how='left').fillna({'Actual_Count': 0})
+    df_dashboard = df_dashboard.dropna(subset=['KOL_ID', 'Area', 'Country'])
+    df_dashboard['KOL_ID'] = df_dashboard['KOL_ID'].astype(int)
+    df_dashboard['Actual_Count'] = df_dashboard['Actual_Count'].astype(int)
+    
+    total_days = (df_dashboard['Contract_End'] - df_dashboard['Contract_Start']).dt.days
+    elapsed_days = np.minimum((report_date - df_dashboard['Contract_Start']).dt.days.clip(lower=0), total_days)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        elapsed_pct = np.where(total_days > 0, (elapsed_days / total_days) * 100, 0.0)
+    target = df_dashboard['Target_Count'].to_numpy()
+    actual = df_dashboard['Actual_Count'].to_numpy()
+    expected, pacing, achievement, status = kpi_arrays(target, actual, elapsed_pct)
+    
+    df_dashboard['Achievement_%'] = achievement
+    df_dashboard['Total_Days'] = total_days
+    df_dashboard['Elapsed_Days'] = elapsed_days
+    df_dashboard['Elapsed_%'] = elapsed_pct
+    df_dashboard['Expected_Count'] = expected
+    df_dashboard['Pacing_Progress_%'] = pacing
+    df_dashboard['Status'] = status
+    df_dashboard['Gap'] = np.clip(target - actual, 0, None)
+    return compact(df_dashboard, DASHBOARD_SCHEMA)
+
+def refresh_kpis(df_dashboard, positions):
+    """Re-derive the count-dependent KPI columns in place for the given row positions."""
+    target = df_dashboard['Target_Count'].to_numpy()[positions]
+    actual = df_dashboard['Actual_Count'].to_numpy()[positions]
+    elapsed_pct = df_dashboard['Elapsed_%'].to_numpy()[positions]
+    expected, pacing, achievement, status = kpi_arrays(target, actual, elapsed_pct)
+    cols = df_dashboard.columns.get_indexer(['Achievement_%', 'Expected_Count', 'Pacing_Progress_%', 'Status', 'Gap'])
+    df_dashboard.iloc[positions, cols[0]] = achievement
+    df_dashboard.iloc[positions, cols[1]] = expected
+    df_dashboard.iloc[positions, cols[2]] = pacing
+    df_dashboard.iloc[positions, cols[3]] = status
+    df_dashboard.iloc[positions, cols[4]] = np.clip(target - actual, 0, None).astype(df_dashboard['Gap'].dtype)
+    return df_dashboard
+
+def compute_dashboard(df_plan, df_actual, today):
+    report_date = today
+    df_plan_master, kol_master = plan_master(df_plan, report_date.year)
+
+    df_actual_proc = activity_dates(df_actual, report_date.year)
+    df_actual_to_date = df_actual_proc[df_actual_proc['Activity_Date'] <= report_date]
+    df_actual_counts = df_actual_to_date.dropna(subset=['Task', 'KOL_ID']).groupby(['KOL_ID', 'Task'], as_index=False, observed=True).size().rename(columns={'size': 'Actual_Count'})
+
+    df_dashboard = dashboard_from_counts(df_plan_master, df_actual_counts, report_date)
+    return df_dashboard, df_actual_to_date, kol_master
+
+def compute_pacing_trend(df_plan, df_actual, as_of_dates):
+    """KPI columns for every (KOL_ID, Task, As_Of) in one pass.
+
+    Activities are bucketed onto the sorted as-of grid and counted cumulatively,
+    so the cost is one pipeline run regardless of how many dates are requested.
+    """
+    as_of = pd.DatetimeIndex(sorted(as_of_dates))
+    year = as_of[-1].year if len(as_of) else YEAR
+    df_plan_master, _ = plan_master(df_plan, year)
+    df_acts = activity_dates(df_actual, year).dropna(subset=['Task', 'KOL_ID'])
+    return pacing_trend_from_counts(df_plan_master, df_acts.assign(Actual_Count=1), as_of)
+
+def pacing_trend_from_counts(df_plan_master, df_counts, as_of_dates):
+    """compute_pacing_trend from pre-aggregated (KOL_ID, Task, Activity_Date, Actual_Count) rows."""
+    as_of = pd.DatetimeIndex(sorted(as_of_dates))
+    df_rows = df_plan_master.dropna(subset=['KOL_ID', 'Area', 'Country']).reset_index(drop=True)
+    row_keys = pd.MultiIndex.from_frame(df_rows[['KOL_ID', 'Task']])
+    row_pos = row_keys.get_indexer(pd.MultiIndex.from_frame(df_counts[['KOL_ID', 'Task']]))
+    date_pos = as_of.searchsorted(df_counts['Activity_Date'].values, side='left')
+    hit = (row_pos >= 0) & (date_pos < len(as_of))
+    counts = np.zeros((len(df_rows), len(as_of)), dtype=np.int64)
+    np.add.at(counts, (row_pos[hit], date_pos[hit]), df_counts['Actual_Count'].to_numpy(dtype=np.int64)[hit])
+    actual = counts.cumsum(axis=1)
+    
+    start = df_rows['Contract_Start'].to_numpy()[:, None]
+    total_days = ((df_rows['Contract_End'].to_numpy() - df_rows['Contract_Start'].to_numpy()) // np.timedelta64(1, 'D'))[:, None]
+    elapsed_days = np.minimum(np.clip((as_of.to_numpy()[None, :] - start) // np.timedelta64(1, 'D'), 0, None), total_days)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        elapsed_pct = np.where(total_days > 0, (elapsed_days / total_days) * 100, 0.0)
+    expected, pacing, _, status = kpi_arrays(df_rows['Target_Count'].to_numpy()[:, None], actual, elapsed_pct)
+    
+    n_dates = len(as_of)
+    return pd.DataFrame({
+        'KOL_ID': np.repeat(df_rows['KOL_ID'].to_numpy(), n_dates),
+        'Task': np.repeat(df_rows['Task'].to_numpy(), n_dates),
+        'As_Of': np.tile(as_of.to_numpy(), len(df_rows)),
+        'Actual_Count': actual.ravel(),
+        'Elapsed_%': elapsed_pct.ravel(),
+        'Expected_Count': expected.ravel(),
+        'Pacing_Progress_%': pacing.ravel(),
+        'Status': status.ravel()
+    })
+
+def average_pacing(df_trend):
+    in_prog = df_trend[df_trend['Status'].isin(IN_PROGRESS_STATUSES)]
+    return in_prog.groupby('As_Of')['Pacing_Progress_%'].mean()
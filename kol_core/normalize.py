@@ -0,0 +1,134 @@
+"""Ingest-time normalization of tracking rows.
+
+The Month, Week and Activity text of the tracking sheet is resolved once,
+when a workbook is ingested into the store, into typed columns:
+
+    Month_Num      1-12, <NA> when the month is not recognized
+    Day            first day of the Week (1w = 1, 2w = 8, ...), <NA> when unknown
+    Activity_Date  Year-Month_Num-Day, NaT when any part is missing or invalid
+    Task           the activity's task, <NA> when it does not map to one
+
+Lookups compare trimmed, case-folded text and are done once per distinct
+value (categoricals map their categories), not once per row. Consumers
+read these columns instead of parsing the strings again; rows that end up
+without a date or task are listed by normalization_report rather than
+dropped without a trace.
+
+Names are cleaned where the frames are, by normalize_names: the contract
+sheet's Task takes the spelling of the task it names, so its targets meet
+the tracking rows mapped to that task, and Area and Country spellings that
+differ only in case or spacing are merged across both sheets.
+"""
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import YEAR, MONTH_MAP, WEEK_START_DAY, ACTIVITY_TO_TASK_MAP, TASKS
+from kol_core.schema import TASK_DTYPE
+
+NORMALIZED_COLUMNS = ['Month_Num', 'Day', 'Activity_Date', 'Task']
+# Part of the store's source tokens, so workbooks ingested before a change here are re-ingested.
+NORMALIZE_VERSION = "normalize-1"
+REPORT_COLUMNS = ['Issue', 'Column', 'Value', 'Rows', 'KOLs']
+NAME_COLUMNS = ['Area', 'Country']
+
+def _key(text):
+    return " ".join(text.split()).casefold()
+
+MONTH_LOOKUP = {_key(k): v for k, v in MONTH_MAP.items()}
+WEEK_LOOKUP = {_key(k): v for k, v in WEEK_START_DAY.items()}
+TASK_LOOKUP = {_key(k): v for k, v in ACTIVITY_TO_TASK_MAP.items()}
+TASK_NAMES = {_key(t): t for t in TASKS}
+
+def lookup(values, table):
+    """values mapped through table (keyed by _key) as an object array; NaN where there is no match."""
+    codes, uniques = pd.factorize(values)
+    mapped = [table.get(_key(u), np.nan) if isinstance(u, str) else np.nan for u in uniques]
+    # codes are -1 for missing values, which picks the trailing NaN.
+    return np.asarray(mapped + [np.nan], dtype=object)[codes]
+
+def merge_spellings(columns, preferred=None):
+    """The columns as categoricals, with text that differs only in case or spacing written one way.
+
+    That is the spelling in preferred (keyed by _key) if there is one, else the
+    most common spelling across all the columns (ties: the first in sort
+    order), with runs of whitespace collapsed.
+    """
+    totals = {}
+    for column in columns:
+        for value, count in column.value_counts().items():
+            if isinstance(value, str) and value.strip():
+                text = " ".join(value.split())
+                totals[text] = totals.get(text, 0) + count
+    spelling = dict(preferred or {})
+    for text, _ in sorted(totals.items(), key=lambda item: (-item[1], item[0])):
+        spelling.setdefault(_key(text), text)
+    merged = []
+    for column in columns:
+        codes, uniques = pd.factorize(column)
+        mapped = [spelling.get(_key(u), u) if isinstance(u, str) else u for u in uniques]
+        merged.append(pd.Series(pd.Categorical(np.asarray(mapped + [np.nan], dtype=object)[codes]), index=column.index, name=column.name))
+    return merged
+
+def normalize_names(df_plan, df_actual):
+    """(df_plan, df_actual) with the plan's Task in its task's spelling and the NAME_COLUMNS merged across both."""
+    df_plan = df_plan.assign(Task=merge_spellings([df_plan['Task']], TASK_NAMES)[0])
+    for name in NAME_COLUMNS:
+        frames = [df for df in (df_plan, df_actual) if name in df]
+        merged = merge_spellings([df[name] for df in frames])
+        if name in df_plan: df_plan = df_plan.assign(**{name: merged.pop(0)})
+        if name in df_actual: df_actual = df_actual.assign(**{name: merged.pop(0)})
+    return df_plan, df_actual
+
+def is_normalized(df_actual):
+    return all(c in df_actual for c in NORMALIZED_COLUMNS)
+
+def normalize_activities(df_actual, year=YEAR):
+    """df_actual with Year filled and the NORMALIZED_COLUMNS added; returned as is when it already has them.
+
+    Rows without a Year are taken to be from year, as for a bare tracking sheet.
+    """
+    if is_normalized(df_actual): return df_actual
+    years = df_actual['Year'].fillna(year) if 'Year' in df_actual else pd.Series(year, index=df_actual.index)
+    month_num = pd.array(lookup(df_actual['Month'], MONTH_LOOKUP), dtype='Int8')
+    day = pd.array(lookup(df_actual['Week'], WEEK_LOOKUP), dtype='Int8')
+    dated = ~(pd.isna(month_num) | pd.isna(day))
+    activity_date = np.full(len(df_actual), np.datetime64('NaT'), dtype='datetime64[ns]')
+    if dated.any():
+        parts = pd.DataFrame({'year': years.to_numpy()[dated], 'month': month_num[dated].astype(int), 'day': day[dated].astype(int)})
+        # Days past the end of the month (5w of a non-leap February) become NaT.
+        activity_date[dated] = pd.to_datetime(parts, errors='coerce').to_numpy()
+    df = df_actual.copy(deep=False)
+    df['Year'] = years.astype('int16')
+    df['Month_Num'] = month_num
+    df['Day'] = day
+    df['Activity_Date'] = activity_date
+    df['Task'] = pd.Categorical(lookup(df_actual['Activity'], TASK_LOOKUP), dtype=TASK_DTYPE)
+    return df
+
+def normalization_issues(df_actual):
+    """The rows of a normalized frame that have no Activity_Date or no Task, with the reason in an Issue column.
+
+    A row is reported once, for the first of: unknown month, unknown week,
+    invalid date, unmapped activity.
+    """
+    month = df_actual['Month_Num'].isna().to_numpy()
+    week = ~month & df_actual['Day'].isna().to_numpy()
+    date = ~month & ~week & df_actual['Activity_Date'].isna().to_numpy()
+    task = ~month & ~week & ~date & df_actual['Task'].isna().to_numpy()
+    issue = np.select([month, week, date, task], ["unknown month", "unknown week", "invalid date", "unmapped activity"], default="")
+    flagged = issue != ""
+    return df_actual[flagged].assign(Issue=issue[flagged])
+
+def normalization_report(df_actual):
+    """Rows and KOLs per (Issue, offending value), most rows first; empty when every row is dated and mapped."""
+    df = normalization_issues(df_actual)
+    if df.empty: return pd.DataFrame(columns=REPORT_COLUMNS)
+    column = df['Issue'].map({"unknown month": 'Month', "unknown week": 'Week', "unmapped activity": 'Activity'})
+    as_text = lambda name: df[name].astype(object).where(df[name].notna(), "(blank)").astype(str)
+    value = np.select([column == 'Month', column == 'Week', column == 'Activity'],
+                      [as_text('Month'), as_text('Week'), as_text('Activity')],
+                      default=as_text('Year') + " " + as_text('Month') + " " + as_text('Week'))
+    df = pd.DataFrame({'Issue': df['Issue'].to_numpy(), 'Column': column.fillna('Year/Month/Week').to_numpy(),
+                       'Value': value, 'KOL_ID': df['KOL_ID'].to_numpy()})
+    report = df.groupby(['Issue', 'Column', 'Value'], sort=False).agg(Rows=('KOL_ID', 'size'), KOLs=('KOL_ID', 'nunique')).reset_index()
+    return report.sort_values(['Rows', 'Issue', 'Value'], ascending=[False, True, True], kind='stable', ignore_index=True)
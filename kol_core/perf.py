@@ -0,0 +1,128 @@
+"""Per-rerun stage timings and cache hit/miss counters.
+
+A run is one execution of the dashboard script. Inside it, stages are timed
+with the stage() context manager; functions wrapped with cached_stage() also
+report whether their Streamlit cache was hit (the function body never ran) or
+missed. The recorder keeps the last max_runs finished runs for every session
+and is safe to share between the server's script threads.
+"""
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+PERCENTILES = (50, 90, 99)
+
+class PerfRecorder:
+    def __init__(self, max_runs=50):
+        self.max_runs = max_runs
+        self._runs = deque(maxlen=max_runs)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 0
+
+    # --- recording --------------------------------------------------------
+    def begin(self, **labels):
+        """Start a run for the calling thread; an unfinished earlier run (st.stop) is dropped."""
+        with self._lock:
+            self._next_id += 1
+            run_id = self._next_id
+        self._local.run = {"run_id": run_id, "started": time.time(), "t0": time.perf_counter(), "labels": labels, "stages": []}
+        self._local.open = []
+
+    def label(self, **labels):
+        """Attach labels (page, year, ...) to the calling thread's current run."""
+        run = getattr(self._local, "run", None)
+        if run is not None: run["labels"].update(labels)
+
+    def finish(self):
+        run = getattr(self._local, "run", None)
+        if run is None: return None
+        self._local.run = None
+        run["seconds"] = time.perf_counter() - run.pop("t0")
+        with self._lock:
+            self._runs.append(run)
+        return run
+
+    @contextmanager
+    def stage(self, name, rows=None, cached=False):
+        """Time a block. Yields a dict whose "rows" may be set inside the block."""
+        entry = {"stage": name, "seconds": None, "rows": rows, "cache": "hit" if cached else None}
+        run = getattr(self._local, "run", None)
+        open_stages = self._local.__dict__.setdefault("open", [])
+        open_stages.append(entry)
+        t0 = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["seconds"] = time.perf_counter() - t0
+            open_stages.pop()
+            if run is not None: run["stages"].append(entry)
+
+    def mark_miss(self):
+        """Record that the innermost cached stage had to compute its result."""
+        for entry in reversed(getattr(self._local, "open", [])):
+            if entry["cache"] is not None:
+                entry["cache"] = "miss"
+                return
+
+    def cached_stage(self, name, cache_decorator, rows=None):
+        """Wrap fn in cache_decorator (st.cache_data(...) etc.) and time every call as stage name.
+
+        rows, if given, maps the result to the number of rows it holds.
+        """
+        def wrap(fn):
+            @functools.wraps(fn)
+            def body(*args, **kwargs):
+                self.mark_miss()
+                return fn(*args, **kwargs)
+            cached = cache_decorator(body)
+
+            @functools.wraps(fn)
+            def call(*args, **kwargs):
+                with self.stage(name, cached=True) as entry:
+                    result = cached(*args, **kwargs)
+                    if rows is not None: entry["rows"] = rows(result)
+                return result
+            call.clear = getattr(cached, "clear", None)
+            return call
+        return wrap
+
+    # --- reporting --------------------------------------------------------
+    def runs(self):
+        with self._lock:
+            return list(self._runs)
+
+    def to_frame(self):
+        """One row per (run, stage); run totals appear as stage "(total)"."""
+        records = []
+        for run in self.runs():
+            base = {"run_id": run["run_id"], "started": pd.Timestamp(run["started"], unit="s"), **run["labels"]}
+            records.append({**base, "stage": "(total)", "seconds": run["seconds"], "rows": None, "cache": None})
+            records.extend({**base, **entry} for entry in run["stages"])
+        return pd.DataFrame.from_records(records)
+
+    def summary(self):
+        """Per-stage call count, latency percentiles (ms) and cache hit rate over the retained runs."""
+        df = self.to_frame()
+        if df.empty: return pd.DataFrame(columns=["stage", "calls"] + [f"p{p}_ms" for p in PERCENTILES] + ["hit_rate_%"])
+        rows = []
+        for name, group in df.groupby("stage", sort=False):
+            seconds = group["seconds"].to_numpy(dtype=float) * 1000
+            row = {"stage": name, "calls": len(group)}
+            row.update({f"p{p}_ms": np.percentile(seconds, p) for p in PERCENTILES})
+            cache = group["cache"].dropna()
+            row["hit_rate_%"] = (cache == "hit").mean() * 100 if len(cache) else np.nan
+            rows.append(row)
+        return pd.DataFrame(rows).sort_values(f"p{PERCENTILES[-1]}_ms", ascending=False, ignore_index=True)
+
+    def to_json(self):
+        return json.dumps(self.runs(), indent=2, default=str)
+
+    def to_csv(self):
+        return self.to_frame().to_csv(index=False)
@@ -0,0 +1,83 @@
+"""KOL profile PDFs served by reference.
+
+Profiles live in static/profiles/<Name>.pdf next to the app so Streamlit's
+static file serving (server.enableStaticServing) can hand them to the
+browser's PDF viewer by URL, with range requests, instead of inlining them.
+Page count and a first-page thumbnail are computed once per file version.
+"""
+import functools
+import os
+import re
+from urllib.parse import quote
+
+STATIC_DIR_NAME = "static"
+PROFILE_SUBDIR = "profiles"
+LEGACY_PROFILE_DIR = "profiles"
+THUMBNAIL_WIDTH = 320
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+def profile_filename(name):
+    return f"{name}.pdf"
+
+def _profile_dirs(app_dir):
+    return [(os.path.join(app_dir, STATIC_DIR_NAME, PROFILE_SUBDIR), f"app/{STATIC_DIR_NAME}/{PROFILE_SUBDIR}/"),
+            (os.path.join(app_dir, LEGACY_PROFILE_DIR), None)]
+
+def profiles_version(app_dir):
+    """mtimes of the profile directories; changes when a PDF is added, removed or renamed."""
+    version = []
+    for directory, _ in _profile_dirs(app_dir):
+        try: version.append(os.stat(directory).st_mtime_ns)
+        except OSError: version.append(None)
+    return tuple(version)
+
+def profile_catalog(app_dir):
+    """{filename: (path, static_url)} for every PDF, from one listing per directory.
+
+    A file in static/profiles shadows one of the same name in the legacy
+    profiles/ directory; static_url is None for files outside static/.
+    """
+    catalog = {}
+    for directory, url_prefix in reversed(_profile_dirs(app_dir)):
+        try: filenames = os.listdir(directory)
+        except OSError: continue
+        for filename in filenames:
+            if filename.lower().endswith(".pdf"):
+                catalog[filename] = (os.path.join(directory, filename), url_prefix + quote(filename) if url_prefix else None)
+    return catalog
+
+def _count_pages(path):
+    with open(path, "rb") as f:
+        n_pages = len(_PAGE_OBJECT.findall(f.read()))
+    return n_pages or None
+
+@functools.cache
+def _pymupdf():
+    # Imported on the first summary rather than with the app.
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf
+        except ImportError:
+            pymupdf = None
+    return pymupdf
+
+def profile_summary(path, mtime_ns):
+    """{size, pages, thumbnail} for a PDF; mtime_ns only versions the result for callers' caches.
+
+    The thumbnail is PNG bytes of the first page and needs PyMuPDF; without it
+    pages is a best-effort count of page objects and thumbnail is None.
+    """
+    summary = {"size": os.path.getsize(path), "pages": None, "thumbnail": None}
+    pymupdf = _pymupdf()
+    if pymupdf is None:
+        summary["pages"] = _count_pages(path)
+        return summary
+    with pymupdf.open(path) as doc:
+        summary["pages"] = doc.page_count
+        if doc.page_count:
+            page = doc.load_page(0)
+            zoom = THUMBNAIL_WIDTH / page.rect.width
+            summary["thumbnail"] = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom)).tobytes("png")
+    return summary
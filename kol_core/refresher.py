@@ -0,0 +1,155 @@
+"""Background refresh of the partitioned store, off the request path.
+
+A DataRefresher thread polls the workbooks' (mtime, size). When a file has
+changed and then stayed unchanged for one poll interval (so a workbook that
+is still being saved is not parsed half-written), it is re-ingested into the
+store. The refresher then publishes a new {year: version} snapshot. It holds
+no frames: callers load a year's partitions when that year is viewed, keyed
+on its published version, so memory follows the years people look at, not
+the years in the store. Before a new snapshot is published, the default
+(newest workbook) year is handed to an optional warm callback, for example
+to load it and precompute the dashboard, so its first viewer finds the work
+done. Viewers keep the previous versions until then, and no request ever
+waits for a parse.
+
+Failures on the background thread (a workbook that cannot be read, a
+corrupt partition, a warm-up that raises) are kept in errors, keyed by
+workbook path or by REFRESH_ERROR / WARM_ERROR, until the next attempt
+succeeds.
+"""
+import os
+import threading
+import time
+
+from kol_core.excel import WorkbookError
+
+REFRESH_ERROR = "(refresh)"
+WARM_ERROR = "(warm)"
+
+def _missing(path):
+    return f"Could not read {path}: file not found"
+
+class DataRefresher:
+    def __init__(self, store, workbooks, contract_tab, tracking_tab, interval=2.0, warm=None):
+        self.store = store
+        self.workbooks = dict(workbooks)
+        self.contract_tab = contract_tab
+        self.tracking_tab = tracking_tab
+        self.interval = interval
+        # warm(year, version) is called for default_year before its version is published.
+        self.warm = warm
+        self.default_year = max(self.workbooks) if self.workbooks else None
+        # {year: version}; replaced whole, never mutated.
+        self._snapshot = {}
+        self._warmed = None
+        self._seen = {}
+        self._pending = {}
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.errors = {}
+        self.last_refresh = None
+
+    # --- watching ---------------------------------------------------------
+    @staticmethod
+    def _signature(path):
+        try:
+            st_res = os.stat(path)
+        except OSError:
+            return None
+        return st_res.st_mtime_ns, st_res.st_size
+
+    def _changed(self):
+        """Workbooks whose signature changed and has held steady since the last poll."""
+        ready = []
+        for source_year, path in self.workbooks.items():
+            signature = self._signature(path)
+            if signature is None:
+                self.errors[path] = _missing(path)
+                continue
+            if signature == self._seen.get(path):
+                self._pending.pop(path, None)
+                # Back unchanged after going missing; a load error for this version stays.
+                if self.errors.get(path) == _missing(path): self.errors.pop(path)
+                continue
+            if self._seen.get(path) is None or self._pending.get(path) == signature:
+                ready.append((source_year, path, signature))
+            else:
+                self._pending[path] = signature
+        return ready
+
+    def refresh(self):
+        """Ingest settled workbook changes and publish a new snapshot if anything moved. Returns True if it did."""
+        with self._refresh_lock:
+            changed = False
+            for source_year, path, signature in self._changed():
+                self._seen[path] = signature
+                self._pending.pop(path, None)
+                try:
+                    changed |= self.store.sync_workbook(path, self.contract_tab, self.tracking_tab, source_year)
+                    self.errors.pop(path, None)
+                except WorkbookError as e:
+                    self.errors[path] = e.report()
+                except OSError as e:
+                    self.errors[path] = f"Could not read {path}: {e.strerror or e}"
+                except Exception as e:
+                    self.errors[path] = f"Data Load Error ({path}): {type(e).__name__}: {e}"
+            if not changed and self._snapshot and self._warmed == self._snapshot.get(self.warm_year(self._snapshot)):
+                return False
+            self._publish()
+            return True
+
+    def warm_year(self, versions):
+        """The year to warm: default_year when it has data, else the newest year."""
+        if self.default_year in versions: return self.default_year
+        return max(versions, default=None)
+
+    def _publish(self, warm=True):
+        versions = {}
+        for year in self.store.years():
+            version = self.store.version(year)
+            if version is not None: versions[year] = version
+        year = self.warm_year(versions)
+        if warm and year is not None and versions[year] != self._warmed:
+            # Warming is best effort; a failure only means the first viewer computes it.
+            if self.warm is not None:
+                try:
+                    self.warm(year, versions[year])
+                    self.errors.pop(WARM_ERROR, None)
+                except Exception as e:
+                    self.errors[WARM_ERROR] = f"Warm-up Error ({year}): {type(e).__name__}: {e}"
+            self._warmed = versions[year]
+        self._snapshot = versions
+        self.last_refresh = time.time()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+                self.errors.pop(REFRESH_ERROR, None)
+            except Exception as e:
+                self.errors[REFRESH_ERROR] = f"Data Refresh Error: {type(e).__name__}: {e}"
+            if self._stop.wait(self.interval): return
+
+    def start(self):
+        """Publish what the store already holds, then ingest and warm in the background.
+
+        Only an empty store is filled in the caller's thread, since there is
+        nothing to show until then.
+        """
+        self._publish(warm=False)
+        if not self._snapshot: self.refresh()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="kol-data-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    # --- reading (the published snapshot) ----------------------------------
+    def years(self):
+        return sorted(self._snapshot, reverse=True)
+
+    def version(self, year):
+        return self._snapshot.get(year)
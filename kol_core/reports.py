@@ -0,0 +1,325 @@
+"""Batch per-KOL progress reports as static HTML.
+
+    python -m kol_core.reports --out reports --year 2025 --as-of November
+    python -m kol_core.reports --out reports --kol "Jung" --kol 1020 --charts
+
+The dashboard rows come from the same IncrementalDashboard the app's
+get_dashboard_data uses, read from the partitioned store (optionally synced
+from --workbook first). Each KOL's report content is hashed. Only reports
+whose hash differs from the last run's manifest, or whose file is missing,
+are rendered again, and that rendering is spread over a process pool.
+
+The manifest keeps one section per contract year, and file names carry the
+year, so runs for different years share an output directory: a run only
+replaces and prunes the reports of its own year.
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import MONTH_MAP, EVENT_COLORS, IN_PROGRESS_STATUSES
+from kol_core.db import workbook_arg
+from kol_core.excel import WorkbookError
+from kol_core.incremental import IncrementalDashboard
+from kol_core.store import PartitionedStore
+
+# Bump when the page layout or file naming changes so every report is rendered again.
+REPORT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.html"
+# Fewer reports than this are rendered in-process; a pool would cost more to start.
+MIN_PARALLEL_REPORTS = 32
+TASK_COLUMNS = ['Task', 'Target_Count', 'Actual_Count', 'Expected_Count', 'Status', 'Pacing_Progress_%', 'Gap']
+SCHEDULE_COLUMNS = ['Activity_Date', 'Activity', 'Task']
+STATUS_COLORS = {'Completed': '#2D5AF5', 'On Track': '#00A9E0', 'Delayed': '#FF6B6B', 'Not Started': '#ADB5BD', 'N/A': '#ADB5BD'}
+
+PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: Inter, Arial, sans-serif; color: #111; background: #F7F9FC; margin: 32px; }}
+.card {{ background: #FFF; border: 1px solid #E0E0E0; border-radius: 10px; padding: 20px; margin-bottom: 20px; }}
+h1 {{ color: #2D5AF5; margin: 0 0 4px; }} .muted {{ color: #666; }}
+table {{ border-collapse: collapse; width: 100%; }} th, td {{ text-align: left; padding: 6px 10px; border-bottom: 1px solid #EEE; }}
+th {{ color: #555; font-weight: 600; }} td.num {{ text-align: right; }}
+.bar {{ background: #F0F0F0; border-radius: 4px; height: 10px; }} .bar > div {{ background: #2D5AF5; border-radius: 4px; height: 10px; }}
+.status {{ font-weight: 600; }}
+</style></head><body>
+{body}
+</body></html>
+"""
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", str(text)).strip("-").lower() or "kol"
+
+def report_filename(year, kol_id, name):
+    return f"{year}-{kol_id}-{_slug(name)}.html"
+
+def _date(value):
+    return None if pd.isna(value) else pd.Timestamp(value).strftime("%Y-%m-%d")
+
+def _number(value, digits=1):
+    return None if pd.isna(value) else round(float(value), digits)
+
+def default_as_of(year, today=None):
+    """End of the current month in the current year, otherwise the end of year."""
+    today = pd.Timestamp.today().normalize() if today is None else pd.Timestamp(today)
+    if year != today.year: return pd.Timestamp(year, 12, 31)
+    return today + pd.offsets.MonthEnd(0)
+
+def as_of_arg(value):
+    """argparse type for --as-of: a month name as given, or the parsed date."""
+    if value in MONTH_MAP: return value
+    try:
+        as_of = pd.Timestamp(value)
+    except ValueError:
+        as_of = pd.NaT
+    if pd.isna(as_of):
+        raise argparse.ArgumentTypeError(f"expected a month name or YYYY-MM-DD, got {value!r}")
+    return as_of.normalize()
+
+def parse_as_of(value, year):
+    if value in MONTH_MAP:
+        return pd.Timestamp(year, MONTH_MAP[value], 1) + pd.offsets.MonthEnd(0)
+    return pd.Timestamp(value)
+
+def select_kols(df_dashboard, kols=(), areas=(), countries=()):
+    """Dashboard rows of the KOLs matching any of kols (ID prefix or name substring) and the area/country filters."""
+    mask = np.ones(len(df_dashboard), dtype=bool)
+    if kols:
+        ids = df_dashboard['KOL_ID'].astype(str)
+        names = df_dashboard['Name'].astype(str).str.lower()
+        hit = np.zeros(len(df_dashboard), dtype=bool)
+        for text in kols:
+            text = text.strip().lower()
+            hit |= (ids.str.startswith(text) | names.str.contains(text, regex=False)).to_numpy()
+        mask &= hit
+    if areas: mask &= df_dashboard['Area'].isin(areas).to_numpy()
+    if countries: mask &= df_dashboard['Country'].isin(countries).to_numpy()
+    return df_dashboard[mask]
+
+def report_payloads(df_dashboard, df_actual_to_date, as_of, year):
+    """{kol_id: JSON-serializable report content}, one entry per KOL in df_dashboard."""
+    df_sched = df_actual_to_date[df_actual_to_date['Year'] == year]
+    schedules = {kol_id: rows.sort_values('Activity_Date', kind='stable') for kol_id, rows in df_sched.groupby('KOL_ID', sort=False)}
+    payloads = {}
+    for kol_id, rows in df_dashboard.groupby('KOL_ID', sort=True, observed=True):
+        first = rows.iloc[0]
+        schedule = schedules.get(kol_id)
+        payloads[int(kol_id)] = {
+            "kol_id": int(kol_id), "name": str(first['Name']), "area": str(first['Area']), "country": str(first['Country']),
+            "as_of": _date(as_of), "contract_start": _date(first['Contract_Start']), "contract_end": _date(first['Contract_End']),
+            "elapsed_pct": _number(first['Elapsed_%']),
+            "tasks": [
+                {"task": str(r['Task']), "target": int(r['Target_Count']), "actual": int(r['Actual_Count']),
+                 "expected": _number(r['Expected_Count']), "status": str(r['Status']),
+                 "pacing_pct": _number(r['Pacing_Progress_%']), "gap": int(r['Gap'])}
+                for r in rows[TASK_COLUMNS].to_dict('records')
+            ],
+            "schedule": [] if schedule is None else [
+                {"date": _date(r['Activity_Date']), "activity": None if pd.isna(r['Activity']) else str(r['Activity']),
+                 "task": None if pd.isna(r['Task']) else str(r['Task'])}
+                for r in schedule[SCHEDULE_COLUMNS].to_dict('records')
+            ]
+        }
+    return payloads
+
+def payload_hash(payload, charts):
+    key = json.dumps({"version": REPORT_VERSION, "charts": charts, "payload": payload}, sort_keys=True)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+# -----------------------------------------------------------------
+# Rendering
+# -----------------------------------------------------------------
+
+def pacing_svg(tasks, width=520, bar_height=22):
+    """Horizontal bars of Pacing_Progress_% per task (capped at 200%) with the 100% line."""
+    label_width, scale_max = 120, 200.0
+    plot_width = width - label_width - 50
+    height = bar_height * len(tasks) + 24
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" role="img" aria-label="Pacing by task">']
+    for i, task in enumerate(tasks):
+        y = 8 + i * bar_height
+        pacing = task["pacing_pct"] or 0.0
+        bar = plot_width * min(pacing, scale_max) / scale_max
+        color = STATUS_COLORS.get(task["status"], "#888")
+        parts.append(f'<text x="{label_width - 8}" y="{y + 14}" font-size="12" text-anchor="end" fill="#111">{html.escape(task["task"])}</text>')
+        parts.append(f'<rect x="{label_width}" y="{y + 3}" width="{bar:.1f}" height="{bar_height - 8}" rx="3" fill="{color}"/>')
+        parts.append(f'<text x="{label_width + bar + 4:.1f}" y="{y + 14}" font-size="11" fill="#555">{pacing:.0f}%</text>')
+    target_x = label_width + plot_width * 100 / scale_max
+    parts.append(f'<line x1="{target_x:.1f}" x2="{target_x:.1f}" y1="4" y2="{height - 14}" stroke="#111" stroke-dasharray="4 3"/>')
+    parts.append(f'<text x="{target_x:.1f}" y="{height - 2}" font-size="10" text-anchor="middle" fill="#555">100%</text></svg>')
+    return "".join(parts)
+
+def _percent(value):
+    return "-" if value is None else f"{value:.0f}%"
+
+def render_report(payload, charts=False):
+    esc = lambda value: "-" if value is None else html.escape(str(value))
+    elapsed = payload["elapsed_pct"] or 0.0
+    task_rows = "".join(
+        f'<tr><td>{esc(t["task"])}</td><td class="num">{t["target"]}</td><td class="num">{t["actual"]}</td>'
+        f'<td class="num">{esc(t["expected"])}</td><td class="status" style="color:{STATUS_COLORS.get(t["status"], "#111")}">{esc(t["status"])}</td>'
+        f'<td class="num">{_percent(t["pacing_pct"])}</td><td class="num">{t["gap"]}</td></tr>'
+        for t in payload["tasks"]
+    )
+    schedule_rows = "".join(
+        f'<tr><td>{esc(s["date"])}</td><td>{esc(s["activity"])}</td>'
+        f'<td style="color:{EVENT_COLORS.get(s["task"], "#888")}">{esc(s["task"] or "Other")}</td></tr>'
+        for s in payload["schedule"]
+    ) or '<tr><td colspan="3" class="muted">No activities recorded yet.</td></tr>'
+    delayed = sum(t["status"] == "Delayed" for t in payload["tasks"])
+    in_progress = [t["pacing_pct"] for t in payload["tasks"] if t["status"] in IN_PROGRESS_STATUSES and t["pacing_pct"] is not None]
+    body = f"""<div class="card"><h1>{esc(payload["name"])}</h1>
+<div class="muted">KOL {payload["kol_id"]} | {esc(payload["country"])} | {esc(payload["area"])} | as of {esc(payload["as_of"])}</div></div>
+<div class="card"><strong>Contract</strong> {esc(payload["contract_start"])} ~ {esc(payload["contract_end"])}
+<div class="muted">Elapsed {elapsed:.1f}% | {delayed} delayed task(s) | average pacing of tasks in progress {f"{np.mean(in_progress):.1f}%" if in_progress else "-"}</div>
+<div class="bar"><div style="width:{min(max(elapsed, 0.0), 100.0):.1f}%"></div></div></div>
+<div class="card"><strong>Tasks</strong>
+<table><tr><th>Task</th><th>Target</th><th>Actual</th><th>Expected</th><th>Status</th><th>Pacing</th><th>Gap</th></tr>{task_rows}</table>
+{pacing_svg(payload["tasks"]) if charts and payload["tasks"] else ""}</div>
+<div class="card"><strong>Schedule</strong>
+<table><tr><th>Date</th><th>Activity</th><th>Task</th></tr>{schedule_rows}</table></div>"""
+    return PAGE.format(title=esc(f'{payload["name"]} - KOL report'), body=body)
+
+def _write(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f: f.write(text)
+    os.replace(tmp_path, path)
+
+def write_report(out_dir, filename, payload, charts):
+    """Worker entry point: render one report to out_dir/filename."""
+    _write(os.path.join(out_dir, filename), render_report(payload, charts))
+    return filename
+
+def render_index(years):
+    """Index page over the manifest's {year: {"as_of", "reports"}} sections, newest year first."""
+    cards = []
+    for year, section in sorted(years.items(), key=lambda item: int(item[0]), reverse=True):
+        rows = "".join(
+            f'<tr><td><a href="{html.escape(e["file"])}">{html.escape(e["name"])}</a></td><td>{kol_id}</td></tr>'
+            for kol_id, e in sorted(section["reports"].items(), key=lambda item: item[1]["name"])
+        )
+        cards.append(f'<div class="card"><strong>{html.escape(str(year))}</strong> <span class="muted">as of {html.escape(section["as_of"])}</span>'
+                     f'<table><tr><th>KOL</th><th>ID</th></tr>{rows}</table></div>')
+    body = '<div class="card"><h1>KOL reports</h1></div>' + "".join(cards)
+    return PAGE.format(title="KOL reports", body=body)
+
+# -----------------------------------------------------------------
+# Batch
+# -----------------------------------------------------------------
+
+def _read_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("years", {})
+    return manifest
+
+def generate_reports(df_dashboard, df_actual_to_date, as_of, year, out_dir, charts=False, workers=None, prune=True):
+    """Render the year's reports that changed since the last run. Returns {"rendered", "unchanged", "removed"} counts.
+
+    prune removes the reports (and manifest entries) of year's KOLs that are
+    not in df_dashboard; pass False when df_dashboard is a filtered subset.
+    Reports of other years are left alone.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = _read_manifest(out_dir)
+    # Reports written before the manifest was split by year cannot be matched to one; drop them.
+    for old in manifest.pop("reports", {}).values():
+        try: os.remove(os.path.join(out_dir, old["file"]))
+        except OSError: pass
+    previous = manifest["years"].get(str(year), {}).get("reports", {})
+    payloads = report_payloads(df_dashboard, df_actual_to_date, as_of, year)
+    entries, todo = {}, []
+    for kol_id, payload in payloads.items():
+        key = str(kol_id)
+        entry = {"name": payload["name"], "file": report_filename(year, kol_id, payload["name"]), "hash": payload_hash(payload, charts)}
+        old = previous.get(key)
+        if old is None or old["hash"] != entry["hash"] or old["file"] != entry["file"] or not os.path.exists(os.path.join(out_dir, entry["file"])):
+            todo.append((entry["file"], payload))
+        entries[key] = entry
+
+    workers = os.cpu_count() or 1 if workers is None else workers
+    if workers > 1 and len(todo) >= MIN_PARALLEL_REPORTS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(write_report, out_dir, filename, payload, charts) for filename, payload in todo]
+            for future in futures: future.result()
+    else:
+        for filename, payload in todo: write_report(out_dir, filename, payload, charts)
+
+    removed = 0
+    for key, old in list(previous.items()):
+        stale_file = key in entries and old["file"] != entries[key]["file"]
+        if (prune and key not in entries) or stale_file:
+            try: os.remove(os.path.join(out_dir, old["file"]))
+            except OSError: pass
+            removed += key not in entries
+    reports = entries if prune else {**{k: v for k, v in previous.items() if k not in entries}, **entries}
+    manifest.pop("as_of", None)
+    manifest["version"] = REPORT_VERSION
+    manifest["years"][str(year)] = {"as_of": _date(as_of), "reports": reports}
+    _write(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, indent=2))
+    _write(os.path.join(out_dir, INDEX_NAME), render_index(manifest["years"]))
+    return {"rendered": len(todo), "unchanged": len(payloads) - len(todo), "removed": removed}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="reports", help="directory for the HTML reports and their manifest")
+    parser.add_argument("--store", default="data_store", help="partitioned store to read")
+    parser.add_argument("--workbook", type=workbook_arg, action="append", default=[], metavar="YEAR=PATH",
+                        help="sync this workbook into the store first; repeatable")
+    parser.add_argument("--contract-tab", default="contracts")
+    parser.add_argument("--tracking-tab", default="tracking")
+    parser.add_argument("--year", type=int, default=None, help="contract year (default: newest --workbook year, else the newest workbook in the store)")
+    parser.add_argument("--as-of", type=as_of_arg, default=None, help="month name or YYYY-MM-DD (default: end of the current month)")
+    parser.add_argument("--kol", action="append", default=[], help="KOL ID prefix or name substring; repeatable")
+    parser.add_argument("--area", action="append", default=[])
+    parser.add_argument("--country", action="append", default=[])
+    parser.add_argument("--charts", action="store_true", help="embed a pacing chart (inline SVG) in each report")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    store = PartitionedStore(args.store)
+    for year, path in args.workbook:
+        try:
+            store.sync_workbook(path, args.contract_tab, args.tracking_tab, year)
+        except WorkbookError as e:
+            print(e.report(), file=sys.stderr)
+            return 1
+        except OSError as e:
+            print(f"error: could not read {path}: {e.strerror or e}", file=sys.stderr)
+            return 1
+    sources = [int(source) for source in store.manifest["sources"]]
+    if not sources or not store.years():
+        print(f"error: {args.store} holds no contract data (pass --workbook YEAR=PATH)", file=sys.stderr)
+        return 1
+    # store.years() also lists the years contracts run into (a 2025 workbook's contracts may end
+    # in 2026); the source years are the ones a workbook was ingested for.
+    year = args.year or max((y for y, _ in args.workbook), default=max(sources))
+    df_plan, df_actual = store.load(year)
+    if df_plan is None:
+        print(f"error: no contracts for {year} in {args.store}", file=sys.stderr)
+        return 1
+    as_of = parse_as_of(args.as_of, year) if args.as_of else default_as_of(year)
+    df_dashboard, df_actual_to_date, _ = IncrementalDashboard(year).update(df_plan, df_actual).dashboard(as_of)
+    filtered = bool(args.kol or args.area or args.country)
+    df_selected = select_kols(df_dashboard, args.kol, args.area, args.country)
+    if df_selected.empty:
+        print("error: no KOLs match the filters", file=sys.stderr)
+        return 1
+    counts = generate_reports(df_selected, df_actual_to_date, as_of, year, args.out, args.charts, args.workers, prune=not filtered)
+    print(f"{args.out}: {counts['rendered']} rendered, {counts['unchanged']} unchanged, {counts['removed']} removed (as of {as_of:%Y-%m-%d})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
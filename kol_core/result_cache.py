@@ -0,0 +1,92 @@
+"""Bounded in-process LRU cache for derived results.
+
+Unlike st.cache_data, entries are keyed on cheap scalar arguments (data
+version, as-of date) instead of hashing whole DataFrames, and results are
+returned as-is rather than copied. Following the Streamlit convention,
+arguments whose names start with an underscore are left out of the key.
+Cached results are shared by every caller and must be treated as read-only.
+"""
+import functools
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+def nbytes(value):
+    """Approximate in-memory size of a result."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray): return value.nbytes
+    if isinstance(value, (tuple, list)): return sum(nbytes(v) for v in value)
+    if isinstance(value, dict): return sum(nbytes(k) + nbytes(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+class ResultCache:
+    def __init__(self, max_entries=32, max_bytes=512 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._entries[key][0]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # One computation per key; concurrent callers for the same key wait for it.
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return self._entries[key][0]
+            try:
+                value = compute()
+            except BaseException:
+                with self._lock: self._key_locks.pop(key, None)
+                raise
+            size = nbytes(value)
+            with self._lock:
+                self.stats["misses"] += 1
+                self._key_locks.pop(key, None)
+                if size <= self.max_bytes:
+                    self._entries[key] = (value, size)
+                    self.total_bytes += size
+                    self._evict()
+        return value
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def memoize(self, fn):
+        """Decorator: cache fn's results keyed on its name and non-underscore arguments."""
+        signature = inspect.signature(fn)
+        key_params = [name for name in signature.parameters if not name.startswith("_")]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__module__, fn.__qualname__) + tuple(bound.arguments[name] for name in key_params)
+            return self.get_or_compute(key, lambda: fn(*args, **kwargs))
+        return wrapper
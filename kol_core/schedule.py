@@ -0,0 +1,40 @@
+import pandas as pd
+
+from kol_core.constants import YEAR, MONTH_MAP, MONTH_LIST_SORTED, EVENT_COLORS
+from kol_core.normalize import normalize_activities
+from kol_core.schema import map_values
+
+DEFAULT_EVENT_COLOR = '#888'
+
+def _events(df):
+    # Rows whose Month is unknown or whose Activity is not text cannot be placed;
+    # an unknown Week places the event in the first week of its month.
+    placeable = df['Month_Num'].notna() & (map_values(df['Activity'], type) == str)
+    df = df[placeable]
+    if df.empty: return []
+    month_num = df['Month_Num'].astype(int)
+    years = df['Year'].astype(int)
+    month_days = pd.to_datetime(pd.DataFrame({'year': years, 'month': month_num, 'day': 1})).dt.days_in_month
+    start_day = df['Day'].fillna(1).astype(int).clip(upper=month_days)
+    end_day = (start_day + 6).clip(upper=month_days)
+    prefix = years.astype(str) + "-" + month_num.astype(str).str.zfill(2) + "-"
+    start = prefix + start_day.astype(str).str.zfill(2)
+    end = prefix + end_day.astype(str).str.zfill(2)
+    color = map_values(df['Task'], EVENT_COLORS).fillna(DEFAULT_EVENT_COLOR)
+    return [
+        {"title": title, "start": s, "end": e, "backgroundColor": c, "borderColor": c, "allDay": True}
+        for title, s, e, c in zip(df['Name'].astype(str), start, end, color)
+    ]
+
+def build_calendar_events(df_actual, month_name, kol_ids, year=YEAR):
+    df = normalize_activities(df_actual, year)
+    return _events(df[df['Month_Num'].isin([MONTH_MAP[month_name]]) & df['KOL_ID'].isin(kol_ids)])
+
+def build_all_calendar_events(df_actual, kol_ids, year=YEAR):
+    """{month name: events} for every month, built in one vectorized pass."""
+    df = normalize_activities(df_actual, year)
+    df = df[df['KOL_ID'].isin(kol_ids) & df['Month_Num'].notna()]
+    events = {m: [] for m in MONTH_MAP}
+    for month_num, df_month in df.groupby('Month_Num', sort=False):
+        events[MONTH_LIST_SORTED[month_num - 1]] = _events(df_month)
+    return events
@@ -0,0 +1,86 @@
+"""Column dtypes of the cleaned frames.
+
+Repetitive text columns (areas, countries, months, activities, ...) are held
+as categoricals and numeric columns are downcast when their values fit, so
+the frames that sit in the caches are a fraction of their object-dtype size
+and group-bys on those columns work on integer codes. Schemas are applied
+once, where frames are cleaned or read back from the store; columns a sheet
+does not have are skipped.
+"""
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import STATUSES, TASKS
+
+STATUS_DTYPE = pd.CategoricalDtype(STATUSES)
+TASK_DTYPE = pd.CategoricalDtype(TASKS)
+
+PLAN_SCHEMA = {
+    'KOL_ID': 'int32', 'Name': 'category', 'Area': 'category', 'Country': 'category',
+    'Task': 'category', 'Activity': 'category', 'Times': 'category', 'Days Left': 'category',
+    'Frequency': 'float32'
+}
+ACTUAL_SCHEMA = {
+    'KOL_ID': 'int32', 'Year': 'int16', 'Name': 'category', 'Area': 'category', 'Country': 'category',
+    'Quarter': 'category', 'Month': 'category', 'Week': 'category', 'Activity': 'category', 'Count': 'float32',
+    'Task': TASK_DTYPE
+}
+DASHBOARD_SCHEMA = {
+    'KOL_ID': 'int32', 'Task': 'category', 'Target_Count': 'int32', 'Actual_Count': 'int32', 'Gap': 'int32',
+    'Total_Days': 'int32', 'Elapsed_Days': 'int32', 'Status': STATUS_DTYPE
+}
+
+def _fits(values, dtype):
+    # Integer targets need whole, in-range values; anything else is left as it is.
+    if values.isna().any(): return False
+    if len(values) == 0: return True
+    info = np.iinfo(dtype)
+    return info.min <= values.min() and values.max() <= info.max and (values % 1 == 0).all()
+
+def column_dtypes(df, schema):
+    """{column: dtype} for the schema columns of df that need (and allow) converting."""
+    dtypes = {}
+    for column, dtype in schema.items():
+        if column not in df: continue
+        values = df[column]
+        if dtype == 'category':
+            if isinstance(values.dtype, pd.CategoricalDtype): continue
+        elif isinstance(dtype, pd.CategoricalDtype):
+            if values.dtype == dtype: continue
+        elif values.dtype == dtype:
+            continue
+        elif np.issubdtype(np.dtype(dtype), np.integer):
+            if not (pd.api.types.is_numeric_dtype(values) and _fits(values, dtype)): continue
+        elif not pd.api.types.is_numeric_dtype(values):
+            continue
+        dtypes[column] = dtype
+    return dtypes
+
+def compact(df, schema):
+    """df with the schema applied; returned unchanged when nothing needs converting."""
+    dtypes = column_dtypes(df, schema)
+    return df.astype(dtypes) if dtypes else df
+
+def map_values(values, mapping):
+    """values.map(mapping) as a plain Series, whether or not values is categorical.
+
+    Series.map on a categorical maps the categories and may hand back another
+    categorical; callers here want the mapped numbers or labels themselves.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    return values.map(mapping)
+
+def memory_report(frames):
+    """Rows, columns and deep memory footprint (MB) of each named frame."""
+    rows = []
+    for name, df in frames.items():
+        if df is None: continue
+        usage = df.memory_usage(index=True, deep=True)
+        by_column = usage.drop('Index', errors='ignore')
+        rows.append({
+            "frame": name, "rows": len(df), "columns": df.shape[1], "memory_MB": usage.sum() / 2**20,
+            "categorical_columns": sum(isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes),
+            "largest_column": by_column.idxmax() if len(by_column) else None
+        })
+    return pd.DataFrame(rows, columns=["frame", "rows", "columns", "memory_MB", "categorical_columns", "largest_column"])
@@ -0,0 +1,182 @@
+"""Year-partitioned on-disk store of cleaned contract and tracking rows.
+
+Layout under the store root:
+
+    plan/year=2025/source=2025.feather       contract rows overlapping 2025
+    tracking/year=2025/source=2025.feather   activities dated in 2025, normalized
+    manifest.json                            sources and partition stats
+
+A source is one workbook, identified by the year its tracking sheet covers.
+Contract rows are written to every year their contract window overlaps, so a
+December-January contract is visible from both years. Re-ingesting a source
+replaces everything it contributed; when two sources hold rows for the same
+KOL in one year, the newer source wins.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from kol_core.frame_cache import workbook_fingerprint
+from kol_core.loader import SCHEMA_VERSION, load_frames
+from kol_core.normalize import NORMALIZE_VERSION, normalize_activities
+from kol_core.schema import PLAN_SCHEMA, ACTUAL_SCHEMA, compact
+
+MANIFEST_NAME = "manifest.json"
+KINDS = ("plan", "tracking")
+
+def fill_contract_window(df_plan, year):
+    """Missing contract dates default to the bounds of the source year, as plan_master does."""
+    return df_plan.assign(**{
+        'Contract Start': df_plan['Contract Start'].fillna(pd.Timestamp(year, 1, 1)),
+        'Contract End': df_plan['Contract End'].fillna(pd.Timestamp(year, 12, 31))
+    })
+
+def tracking_years(df_actual, year):
+    if 'Year' not in df_actual: return pd.Series(year, index=df_actual.index)
+    return pd.to_numeric(df_actual['Year'], errors='coerce').fillna(year).astype(int)
+
+class PartitionedStore:
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._manifest = None
+        self._lock = threading.RLock()
+
+    # --- manifest ---------------------------------------------------------
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.root, MANIFEST_NAME), encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+            self._manifest.setdefault("sources", {})
+            self._manifest.setdefault("partitions", {})
+        return self._manifest
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = os.path.join(self.root, MANIFEST_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.root, MANIFEST_NAME))
+        # Swapped in whole, so a reader on another thread never sees it change mid-iteration.
+        self._manifest = manifest
+
+    def refresh(self):
+        """Drop the in-memory manifest so the next access re-reads it from disk."""
+        self._manifest = None
+        return self
+
+    # --- writing ----------------------------------------------------------
+    def _write(self, kind, year, source, df):
+        rel_path = f"{kind}/year={year}/source={source}.feather"
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        feather.write_feather(df.reset_index(drop=True), tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+        return rel_path
+
+    def ingest(self, df_plan, df_actual, source_year, token):
+        """Replace every partition contributed by source_year with these cleaned frames."""
+        source = str(source_year)
+        df_plan = fill_contract_window(df_plan, source_year)
+        start_year = df_plan['Contract Start'].dt.year
+        end_year = df_plan['Contract End'].dt.year.clip(lower=start_year)
+        df_actual = normalize_activities(df_actual.assign(Year=tracking_years(df_actual, source_year)), source_year)
+
+        partitions = {}
+        for year in range(int(start_year.min()), int(end_year.max()) + 1) if len(df_plan) else ():
+            df_year = df_plan[(start_year <= year) & (end_year >= year)]
+            if df_year.empty: continue
+            rel_path = self._write("plan", year, source, df_year)
+            partitions[rel_path] = {"kind": "plan", "year": year, "source": source, "rows": len(df_year),
+                                    "first_start_year": int(df_year['Contract Start'].dt.year.min()), "token": token}
+        for year, df_year in df_actual.groupby('Year', sort=True):
+            rel_path = self._write("tracking", int(year), source, df_year)
+            partitions[rel_path] = {"kind": "tracking", "year": int(year), "source": source, "rows": len(df_year), "token": token}
+
+        manifest = {**self.manifest, "sources": dict(self.manifest["sources"]), "partitions": dict(self.manifest["partitions"])}
+        stale = [rel_path for rel_path, entry in manifest["partitions"].items() if entry["source"] == source and rel_path not in partitions]
+        for rel_path in stale: manifest["partitions"].pop(rel_path)
+        manifest["partitions"].update(partitions)
+        manifest["sources"][source] = {"token": token}
+        self._save_manifest(manifest)
+        # Removed only once the new manifest no longer lists them.
+        for rel_path in stale:
+            try: os.remove(os.path.join(self.root, rel_path))
+            except OSError: pass
+
+    def sync_workbook(self, excel_file_path, contract_tab, tracking_tab, source_year):
+        """Ingest the workbook unless this exact version is already in the store. Returns True if ingested."""
+        fingerprint = workbook_fingerprint(excel_file_path)
+        token = f"{fingerprint['sha256']}:{contract_tab}:{tracking_tab}:{SCHEMA_VERSION}:{NORMALIZE_VERSION}"
+        with self._lock:
+            if self.manifest["sources"].get(str(source_year), {}).get("token") == token: return False
+            df_plan, df_actual = load_frames(excel_file_path, contract_tab, tracking_tab)
+            self.ingest(df_plan, df_actual, source_year, token)
+        return True
+
+    # --- reading ----------------------------------------------------------
+    def _entries(self, kind, year):
+        return sorted(((rel_path, entry) for rel_path, entry in self.manifest["partitions"].items()
+                       if entry["kind"] == kind and entry["year"] == year), key=lambda item: int(item[1]["source"]))
+
+    def years(self):
+        """Years that have contract rows, newest first."""
+        return sorted({entry["year"] for entry in self.manifest["partitions"].values() if entry["kind"] == "plan"}, reverse=True)
+
+    def _read_partitions(self, entries):
+        frames = []
+        for rel_path, entry in entries:
+            df = feather.read_table(os.path.join(self.root, rel_path), memory_map=True).to_pandas()
+            frames.append(df.assign(_source=int(entry["source"])))
+        return frames
+
+    def read_tracking(self):
+        """Every tracking row in the store, oldest year first, or None when there are none."""
+        entries = sorted(((rel_path, entry) for rel_path, entry in self.manifest["partitions"].items() if entry["kind"] == "tracking"),
+                         key=lambda item: (item[1]["year"], int(item[1]["source"])))
+        frames = self._read_partitions(entries)
+        return compact(pd.concat(frames, ignore_index=True).drop(columns='_source'), ACTUAL_SCHEMA) if frames else None
+
+    def _partitions_for(self, year):
+        plan_entries = self._entries("plan", year)
+        if not plan_entries: return [], []
+        first_year = min(entry["first_start_year"] for _, entry in plan_entries)
+        tracking_entries = [item for y in range(first_year, year + 1) for item in self._entries("tracking", y)]
+        return plan_entries, tracking_entries
+
+    def version(self, year):
+        """Content token of everything load(year) reads; changes whenever any of it is re-ingested."""
+        plan_entries, tracking_entries = self._partitions_for(year)
+        key = "|".join(f"{rel_path}={entry['token']}" for rel_path, entry in plan_entries + tracking_entries)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() if key else None
+
+    def load(self, year):
+        """(df_plan, df_actual) for contracts active in year.
+
+        Only the plan partition for year and the tracking partitions from the
+        earliest contract start up to year are read. Tracking rows from earlier
+        years are kept only for KOLs whose contract had already started then.
+        """
+        plan_entries, tracking_entries = self._partitions_for(year)
+        if not plan_entries: return None, None
+        df_plan = pd.concat(self._read_partitions(plan_entries), ignore_index=True)
+        newest = df_plan.groupby('KOL_ID')['_source'].transform('max')
+        df_plan = df_plan[df_plan['_source'] == newest].drop(columns='_source').reset_index(drop=True)
+
+        tracking = self._read_partitions(tracking_entries)
+        df_actual = pd.concat(tracking, ignore_index=True).drop(columns='_source') if tracking else pd.DataFrame(columns=['KOL_ID', 'Year'])
+        earlier = df_actual['Year'] < year
+        if earlier.any():
+            start_year = df_plan.groupby('KOL_ID')['Contract Start'].min().dt.year
+            kol_start = df_actual['KOL_ID'].map(start_year)
+            df_actual = df_actual[~earlier | (df_actual['Year'] >= kol_start)].reset_index(drop=True)
+        # Concatenating categoricals with differing categories yields object columns.
+        return compact(df_plan, PLAN_SCHEMA), compact(df_actual, ACTUAL_SCHEMA)
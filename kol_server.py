@@ -0,0 +1,13 @@
+"""Serve the dashboard with long-lived cache headers on the bundled static assets.
+
+    streamlit run kol_server.py
+
+Same app as `streamlit run kol_dashboard_r.py`; this entry point only adds
+StaticCacheMiddleware, so browsers stop revalidating the fonts and logo.
+"""
+import streamlit as st
+from starlette.middleware import Middleware
+
+from kol_core.assets import StaticCacheMiddleware
+
+app = st.App("kol_dashboard_r.py", middleware=[Middleware(StaticCacheMiddleware)])
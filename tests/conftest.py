@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_frames, write_workbook
+from kol_core.constants import YEAR
+from kol_core.loader import clean_frames
+
+@pytest.fixture(scope="session")
+def frames():
+    """Cleaned synthetic (df_plan, df_actual): 300 KOLs, 3,000 tracking rows."""
+    return clean_frames(*generate_frames(n_kols=300, n_tracking_rows=3000, seed=7))
+
+@pytest.fixture
+def month_ends():
+    return [pd.Timestamp(YEAR, month, 1) + pd.offsets.MonthEnd(0) for month in range(1, 13)]
+
+def year_frames(year, n_kols, id_offset=0, span=0, seed=0):
+    """Raw synthetic frames moved to year, KOL_IDs shifted by id_offset; the last span KOLs' contracts run 365 days."""
+    df_plan, df_actual = generate_frames(n_kols=n_kols, seed=seed)
+    shift = pd.DateOffset(years=year - YEAR)
+    spanning = df_plan['KOL_ID'] > df_plan['KOL_ID'].max() - span
+    df_plan['Contract Start'] += shift
+    df_plan['Contract End'] = (df_plan['Contract End'] + shift).mask(spanning, df_plan['Contract Start'] + pd.Timedelta(days=365))
+    df_plan['KOL_ID'] += id_offset
+    df_actual['KOL_ID'] += id_offset
+    return df_plan, df_actual
+
+# 2025: KOLs 100001-100040, the last 10 contracted into 2026. 2026: KOLs 100036-100065, so
+# 100036-100040 are in both workbooks, the last 5 contracted into 2027.
+YEAR_WORKBOOKS = {YEAR: dict(n_kols=40, span=10), YEAR + 1: dict(n_kols=30, id_offset=35, span=5, seed=1)}
+
+@pytest.fixture(scope="session")
+def make_year_frames():
+    return year_frames
+
+@pytest.fixture(scope="session")
+def year_sources():
+    """{source year: raw (df_plan, df_actual)} for the two YEAR_WORKBOOKS."""
+    return {year: year_frames(year, **kwargs) for year, kwargs in YEAR_WORKBOOKS.items()}
+
+@pytest.fixture(scope="session")
+def year_workbooks(tmp_path_factory, year_sources):
+    """{source year: workbook path} for year_sources."""
+    root = tmp_path_factory.mktemp("workbooks")
+    return {year: write_workbook(root / f"{year}.xlsx", *frames) for year, frames in year_sources.items()}
@@ -0,0 +1,18 @@
+import os
+
+from kol_core.assets import FONT_FILES, FONT_SOURCE, LOGO_FILE, LOGO_SOURCE, assets_dir, font_face_css, logo_url
+
+def test_missing_assets_fall_back_to_their_source(tmp_path):
+    assert logo_url(tmp_path) == LOGO_SOURCE
+    css = font_face_css(tmp_path)
+    assert all(f"url('{FONT_SOURCE}{filename}')" in css for filename in FONT_FILES.values())
+
+def test_bundled_assets_get_versioned_urls(tmp_path):
+    os.makedirs(assets_dir(tmp_path))
+    for filename in [LOGO_FILE, FONT_FILES[600]]:
+        (tmp_path / "static" / "assets" / filename).write_bytes(b"x")
+    url = logo_url(tmp_path)
+    assert url.startswith(f"app/static/assets/{LOGO_FILE}?v=")
+    rules = font_face_css(tmp_path).splitlines()
+    assert len(rules) == len(FONT_FILES)
+    assert [rule for rule in rules if "http" not in rule] == [rule for rule in rules if "font-weight: 600" in rule]
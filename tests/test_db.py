@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from kol_core.activity_log import ActivityLogIndex
+from kol_core.constants import YEAR
+from kol_core.db import SQLiteBackend, build_database
+from kol_core.metrics import compute_dashboard, compute_pacing_trend
+from kol_core.normalize import NORMALIZED_COLUMNS
+from kol_core.store import PartitionedStore
+
+KPI_COLUMNS = ['Name', 'Area', 'Country', 'Target_Count', 'Actual_Count', 'Achievement_%', 'Elapsed_%',
+               'Expected_Count', 'Pacing_Progress_%', 'Status', 'Gap']
+TREND_COLUMNS = ['Actual_Count', 'Elapsed_%', 'Expected_Count', 'Pacing_Progress_%', 'Status']
+# Across the year boundary, where YEAR's activities carry over into YEAR + 1 contracts.
+AS_OF_DATES = [pd.Timestamp(YEAR, 12, 31), pd.Timestamp(YEAR + 1, 3, 31), pd.Timestamp(YEAR + 1, 12, 31), pd.Timestamp(YEAR + 2, 6, 30)]
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory, year_workbooks):
+    root = tmp_path_factory.mktemp("db")
+    store = PartitionedStore(root / "store")
+    for year, path in year_workbooks.items():
+        store.sync_workbook(path, "contracts", "tracking", year)
+    db_path = str(root / "kol.db")
+    build_database(store, db_path)
+    return store, SQLiteBackend(db_path)
+
+def by_key(df, key, columns):
+    df = df.astype({c: str for c in ['Task', 'Status'] if c in df})
+    return df.sort_values(key, ignore_index=True)[key + columns]
+
+def test_same_years(backends):
+    store, db = backends
+    assert db.years() == store.years()
+
+@pytest.mark.parametrize("today", AS_OF_DATES, ids=lambda d: f"{d:%Y-%m-%d}")
+def test_dashboard_matches_store(backends, today):
+    store, db = backends
+    expected, _, expected_master = compute_dashboard(*store.load(today.year), today)
+    df_dashboard, kol_master = db.dashboard(today)
+    assert len(df_dashboard) == len(expected) and expected['Actual_Count'].sum() > 0
+    key = ['KOL_ID', 'Task']
+    pd.testing.assert_frame_equal(by_key(df_dashboard, key, KPI_COLUMNS), by_key(expected, key, KPI_COLUMNS), check_dtype=False, check_categorical=False)
+    pd.testing.assert_frame_equal(by_key(kol_master, ['KOL_ID'], ['Contract_Start', 'Contract_End']),
+                                  by_key(expected_master, ['KOL_ID'], ['Contract_Start', 'Contract_End']), check_dtype=False)
+
+@pytest.mark.parametrize("year", [YEAR, YEAR + 1])
+def test_pacing_trend_matches_store(backends, year):
+    store, db = backends
+    as_of_dates = [pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0) for month in range(1, 13)]
+    expected = compute_pacing_trend(*store.load(year), as_of_dates)
+    key = ['As_Of', 'KOL_ID', 'Task']
+    pd.testing.assert_frame_equal(by_key(db.pacing_trend(as_of_dates), key, TREND_COLUMNS), by_key(expected, key, TREND_COLUMNS), check_dtype=False)
+
+LOG_QUERIES = [
+    {},
+    {"area": "Europe", "month": "Mar"},
+    {"kol": "10004", "sort_by": "Activity"},
+    {"sort_by": "Month", "ascending": False, "page": 2, "page_size": 25},
+    {"kol": "dr. ", "sort_by": "Week", "page": 3, "page_size": 10},
+]
+
+@pytest.mark.parametrize("year", [YEAR, YEAR + 1])
+@pytest.mark.parametrize("query", LOG_QUERIES, ids=str)
+def test_activity_log_page_matches_store(backends, year, query):
+    store, db = backends
+    df_actual = store.load(year)[1]
+    df_actual_year = df_actual[df_actual['Year'] == year]
+    columns = [c for c in df_actual_year.columns if c not in NORMALIZED_COLUMNS]
+    assert db.tracking_columns == columns
+    filters = [query.get(name) for name in ("area", "month", "kol")]
+    paging = [query.get("sort_by"), query.get("ascending", True), query.get("page", 1), query.get("page_size", 50)]
+    expected, expected_total = ActivityLogIndex(df_actual_year).query(*filters, *paging)
+    df_log, total = db.activity_log(year, *filters, *paging)
+    assert total == expected_total > 0
+    as_records = lambda df: df[columns].astype(object).where(df[columns].notna(), None).to_dict("records")
+    assert as_records(df_log) == as_records(expected)
@@ -0,0 +1,64 @@
+import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from kol_core.excel import ACTUAL_COLUMNS, PLAN_COLUMNS, WorkbookError, read_sheets
+from kol_core.loader import clean_frames
+
+PLAN_ROWS = [
+    ['Name', 'KOL_ID', 'Area', 'Country', 'Contract Start', 'Contract End', 'Task', 'Frequency', 'Lat', 'Lon', 'Notes'],
+    ['Dr. A', 100001.0, 'Europe', 'UK', datetime.datetime(2025, 1, 15), datetime.datetime(2025, 12, 31), 'Lecture', 2.0, 51.5, -0.125, 'x'],
+    ['Dr. B', 100002, 'N/A', 'NA', '2025-03-01', None, 'Webinar', 'NA', 'n/a', None, None],
+    [None, None, None, None, None, None, None, None, None, None, None],
+    ['Dr. C', '100003', 'Asia', 'null', datetime.datetime(2025, 6, 1, 12, 30), datetime.date(2026, 5, 31), 'Article', 1.5, 37.25, 127.0, 3.0],
+    ['#N/A', 100004.0, '', 'Korea', datetime.datetime(2025, 2, 1), datetime.datetime(2025, 8, 31), 'nan', 3, 'NaN', '-nan', None],
+]
+TRACKING_ROWS = [
+    ['Name', 'KOL_ID', 'Area', 'Country', 'Quarter', 'Month', 'Week', 'Activity', 'Count', 'Remark'],
+    ['Dr. A', 100001.0, 'Europe', 'UK', 'Q1', 'Jan', '1w', 'Lecture', 1.0, 'ok'],
+    ['Dr. B', 100002, 'N/A', 'NA', 'Q1', ' feb ', 2.0, 'Webinar', None, None],
+    [None, None, None, None, None, None, None, None, None, None],
+    ['Dr. C', 100003.0, 'Asia', 'None', 'Q2', 'April', '3w', 'null', 'n/a', 1.0],
+    ['Dr. D', 100004, '#NA', 'Korea', '', 'Mar', 5, 'Case Report', 2.5, None],
+]
+
+def write_sheets(path, sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows: sheet.append(row)
+    workbook.save(path)
+    return path
+
+def records(df):
+    """Rows as dicts of cell text, None where missing, so dtypes do not matter but 2 and 2.0 differ."""
+    df = df.reset_index(drop=True).astype(object)
+    return df.where(df.isna(), df.astype(str)).where(df.notna(), None).to_dict("records")
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_matches_read_excel_on_kept_columns(tmp_path, parallel):
+    path = write_sheets(tmp_path / "book.xlsx", {"contracts": PLAN_ROWS, "tracking": TRACKING_ROWS})
+    df_plan, df_actual = read_sheets(path, "contracts", "tracking", parallel=parallel)
+    assert list(df_plan.columns) == [c for c in PLAN_COLUMNS if c in PLAN_ROWS[0]]
+    assert list(df_actual.columns) == [c for c in ACTUAL_COLUMNS if c in TRACKING_ROWS[0]]
+    # Cells are typed per column while reading, so compare what clean_frames makes of each.
+    # Blank rows are skipped while reading; read_excel keeps them until clean_frames drops them.
+    expected = clean_frames(*(pd.read_excel(path, sheet_name=sheet) for sheet in ("contracts", "tracking")))
+    for df, df_expected in zip(clean_frames(df_plan, df_actual), expected):
+        assert len(df) == 4
+        assert records(df) == records(df_expected[df.columns])
+
+def test_problems_from_both_sheets_are_reported_together(tmp_path):
+    plan_rows = PLAN_ROWS + [['Dr. E', 'abc', 'Asia', 'Japan', 'soon', None, 'Lecture', 1, None, None, None]]
+    tracking_rows = [row[:6] + row[7:] for row in TRACKING_ROWS]  # no Week column
+    path = write_sheets(tmp_path / "book.xlsx", {"contracts": plan_rows, "tracking": tracking_rows})
+    with pytest.raises(WorkbookError) as e:
+        read_sheets(path, "contracts", "tracking", parallel=False)
+    assert e.value.problems == [
+        "sheet 'contracts', column 'KOL_ID' is not a number in row(s) 7",
+        "sheet 'contracts', column 'Contract Start' is not a date in row(s) 7",
+        "sheet 'tracking' is missing column(s) 'Week' (found: Name, KOL_ID, Area, Country, Quarter, Month, Activity, Count, Remark)",
+    ]
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kol_core.geo import MAX_CLUSTER_ZOOM, in_bounds, precompute_clusters, view_layers
+
+ANTIMERIDIAN = [200, 201, 202]
+LONDON = 203
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(3)
+    # 200 KOLs around Seoul, 3 either side of the antimeridian, 1 in London.
+    lat = np.concatenate([37.5 + rng.normal(0, 0.5, 200), [-17.7, -18.1, -16.5], [51.5]])
+    lon = np.concatenate([127.0 + rng.normal(0, 0.5, 200), [178.4, 179.9, -179.8], [-0.1]])
+    n = len(lat)
+    return pd.DataFrame({'KOL_ID': np.arange(n), 'Name': [f"KOL {i}" for i in range(n)], 'Country': "X", 'Area': "Y", 'lat': lat, 'lon': lon})
+
+@pytest.fixture(scope="module")
+def clusters(points):
+    return precompute_clusters(points)
+
+def marker_ids(layers):
+    return set(layers[1]['KOL_ID'])
+
+def drawn_count(layers):
+    return int(layers[0]['count'].sum()) + len(layers[1])
+
+@pytest.mark.parametrize("bounds", [(-30, 170, -5, -170), (-30, 170, -5, 190), (-30, -190, -5, -170)])
+def test_view_across_antimeridian(points, clusters, bounds):
+    # Leaflet reports a view across the antimeridian as west > east or with a longitude past 180.
+    layers = view_layers(points, clusters, 6, bounds)
+    assert marker_ids(layers) == set(ANTIMERIDIAN)
+    assert in_bounds(points['lat'].to_numpy(), points['lon'].to_numpy(), bounds).sum() == 3
+
+def test_world_view_clusters_everything(points, clusters):
+    layers = view_layers(points, clusters, 2, (-85, -540, 85, 540), max_markers=50)
+    assert drawn_count(layers) == len(points)
+    assert len(layers[0]) > 0 and layers[0]['count'].min() > 1
+    assert LONDON in marker_ids(layers)  # alone in its cell, so drawn as a marker
+
+def test_few_points_in_view_are_markers(points, clusters):
+    layers = view_layers(points, clusters, 4, (30, 100, 45, 150), max_markers=500)
+    assert layers[0].empty
+    assert marker_ids(layers) == set(range(200))
+
+def test_no_bounds_and_zoom_clamping(points, clusters):
+    layers = view_layers(points, clusters, MAX_CLUSTER_ZOOM + 5, None)
+    assert layers[0].empty and len(layers[1]) == len(points)
+    assert drawn_count(view_layers(points, clusters, -3, None, max_markers=10)) == len(points)
+
+def test_empty_view(points, clusters):
+    layers = view_layers(points, clusters, 8, (60, 60, 70, 70))
+    assert layers[0].empty and layers[1].empty
@@ -0,0 +1,20 @@
+import json
+import subprocess
+import sys
+
+from benchmarks.run import REPO_ROOT, app_imports, import_seconds
+
+# Loaded only when the Executive page renders a chart, the map or the calendar, or a profile summary.
+LAZY_MODULES = ["altair", "folium", "streamlit_folium", "streamlit_calendar", "pymupdf", "fitz"]
+# benchmarks/baseline.json records about 0.7 s; the budget leaves room for slow CI machines.
+IMPORT_BUDGET_SECONDS = 5.0
+
+def test_app_imports_leave_heavy_modules_unloaded():
+    source = app_imports()
+    assert "kol_core" in source
+    code = f"import json, sys\n{source}\nprint(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    assert json.loads(out.splitlines()[-1]) == []
+
+def test_cold_app_import_fits_the_budget():
+    assert import_seconds(app_imports(), repeat=1) < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from kol_core.constants import YEAR
+from kol_core.incremental import IncrementalDashboard
+from kol_core.metrics import compute_dashboard
+
+TODAY = pd.Timestamp(YEAR, 12, 31)
+
+def assert_matches(engine, df_plan, df_actual, today=TODAY):
+    expected, expected_to_date, _ = compute_dashboard(df_plan, df_actual, today)
+    df_dashboard, df_actual_to_date, _ = engine.dashboard(today)
+    pd.testing.assert_frame_equal(df_dashboard.reset_index(drop=True), expected.reset_index(drop=True))
+    assert len(df_actual_to_date) == len(expected_to_date)
+
+@pytest.fixture
+def engine(frames):
+    df_plan, df_actual = frames
+    return IncrementalDashboard(YEAR).update(df_plan, df_actual.iloc[:2000])
+
+def test_first_update_is_full(engine, frames):
+    assert engine.last_update == {"mode": "full", "rows": 2000}
+    assert_matches(engine, frames[0], frames[1].iloc[:2000])
+
+def test_append_applies_only_new_rows(engine, frames):
+    df_plan, df_actual = frames
+    engine.dashboard(TODAY)  # cached snapshot, patched by the append
+    engine.update(df_plan, df_actual)
+    assert engine.last_update == {"mode": "delta", "rows": 1000}
+    assert_matches(engine, df_plan, df_actual)
+
+def test_same_rows_are_unchanged(engine, frames):
+    df_plan, df_actual = frames
+    engine.update(df_plan, df_actual.iloc[:2000].copy())
+    assert engine.last_update["mode"] == "unchanged"
+
+@pytest.mark.parametrize("rows", [[7, 8], [2998]])
+def test_edited_history_rebuilds(frames, rows):
+    df_plan, df_actual = frames
+    engine = IncrementalDashboard(YEAR).update(df_plan, df_actual)
+    engine.dashboard(TODAY)
+    df_edited = df_actual.copy()
+    # Move the rows to a month and activity they are not already counted under.
+    for row in rows:
+        month = "Feb" if df_edited.at[row, 'Month'] == "Jan" else "Jan"
+        activity = "Webinar" if df_edited.at[row, 'Activity'] != "Webinar" else "Lecture"
+        df_edited.loc[row, ['Month', 'Activity']] = [month, activity]
+    engine.update(df_plan, df_edited)
+    assert engine.last_update == {"mode": "full", "rows": 3000}
+    assert_matches(engine, df_plan, df_edited)
+
+def test_shrunk_history_rebuilds(engine, frames):
+    df_plan, df_actual = frames
+    engine.dashboard(TODAY)
+    engine.update(df_plan, df_actual.iloc[:1500])
+    assert engine.last_update == {"mode": "full", "rows": 1500}
+    assert_matches(engine, df_plan, df_actual.iloc[:1500])
+
+def test_plan_edit_rebuilds(engine, frames):
+    df_plan, df_actual = frames
+    df_plan = df_plan.assign(Frequency=df_plan['Frequency'] + 1)
+    engine.update(df_plan, df_actual.iloc[:2000])
+    assert engine.last_update["mode"] == "full"
+    assert_matches(engine, df_plan, df_actual.iloc[:2000])
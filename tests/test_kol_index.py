@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from kol_core.constants import YEAR
+from kol_core.kol_index import KolIndex
+from kol_core.metrics import compute_dashboard
+
+@pytest.fixture(scope="module")
+def index(frames):
+    df_dashboard, _, _ = compute_dashboard(*frames, pd.Timestamp(YEAR, 11, 30))
+    return KolIndex(df_dashboard)
+
+def test_names_are_sorted_and_unique(index):
+    assert index.names == sorted(set(index.names))
+
+def test_id_prefix(index):
+    record = index.record(index.names[0])
+    kol_id = str(record['KOL_ID'])
+    assert index.names[0] in index.search(kol_id)
+    assert all(str(index.record(name)['KOL_ID']).startswith(kol_id[:4]) for name in index.search(kol_id[:4]))
+
+def test_words_in_any_order_and_typos(index):
+    name = index.names[0]
+    first, last = name.split()[1:3]
+    assert name in index.search(f"{last} {first}")
+    assert name in index.search(f"{first[:-1]}x {last}")
+
+def test_record_tasks(index):
+    record = index.record(index.names[0])
+    assert list(record['tasks'].columns) == ['Task', 'Status', 'Pacing_Progress_%']
+    assert index.record("no such KOL") is None
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from kol_core.constants import YEAR
+from kol_core.loader import clean_frames
+from kol_core.metrics import compute_dashboard
+from kol_core.normalize import REPORT_COLUMNS, normalization_report, normalize_activities
+
+def tracking(rows):
+    return pd.DataFrame(rows, columns=['KOL_ID', 'Month', 'Week', 'Activity'])
+
+def test_month_week_and_activity_match_any_case_and_spacing():
+    df = normalize_activities(tracking([
+        [1, " feb ", " 2W", " LECTURE "],
+        [1, "JUNE", "1w", "case   Report"],
+        [2, "july", "5W ", "contents\tcreation"],
+        [2, "April", "3w", "CONTENTSCREATION"],
+    ]), YEAR)
+    assert df['Task'].tolist() == ["Lecture", "Case Report", "SNS Posting", "SNS Posting"]
+    assert df['Month_Num'].tolist() == [2, 6, 7, 4]
+    assert df['Day'].tolist() == [8, 1, 29, 15]
+    assert df['Activity_Date'].tolist() == [pd.Timestamp(YEAR, 2, 8), pd.Timestamp(YEAR, 6, 1), pd.Timestamp(YEAR, 7, 29), pd.Timestamp(YEAR, 4, 15)]
+
+def test_plan_task_and_area_spellings_meet_the_tracking_rows():
+    df_plan = pd.DataFrame({
+        'KOL_ID': [1, 1, 2, 2], 'Name': "Dr. A", 'Area': ["Europe", "europe ", " EUROPE", "APAC"], 'Country': ["UK", "UK", "uk", "Korea"],
+        'Contract Start': pd.Timestamp(YEAR, 1, 1), 'Contract End': pd.Timestamp(YEAR, 12, 31),
+        'Task': [" lecture", "CASE  REPORT", "(Other)", "(other) "], 'Frequency': [2, 1, 1, 1]
+    })
+    df_actual = tracking([[1, "Jan", "1w", "Lecture"], [1, "Mar", "2w", "lecture"], [1, "Mar", "3w", "Clinical case report"]])
+    df_plan, df_actual = clean_frames(df_plan, df_actual.assign(Area=" Europe"))
+    assert df_plan['Task'].tolist() == ["Lecture", "Case Report", "(Other)", "(Other)"]
+    assert df_plan['Area'].tolist() == ["Europe", "Europe", "Europe", "APAC"]
+    assert df_plan['Country'].tolist() == ["UK", "UK", "UK", "Korea"]
+    assert set(df_actual['Area']) == {"Europe"}
+
+    df_dashboard = compute_dashboard(df_plan, df_actual, pd.Timestamp(YEAR, 12, 31))[0]
+    counts = df_dashboard.set_index(['KOL_ID', 'Task'])[['Target_Count', 'Actual_Count']]
+    assert counts.to_dict('index') == {
+        (1, "Lecture"): {'Target_Count': 2, 'Actual_Count': 2},
+        (1, "Case Report"): {'Target_Count': 1, 'Actual_Count': 1},
+        (2, "(Other)"): {'Target_Count': 2, 'Actual_Count': 0},
+    }
+
+def test_normalization_report_counts_rows_and_kols_per_issue():
+    df = normalize_activities(tracking([
+        [1, "Jan", "1w", "Lecture"],
+        [1, "Smarch", "1w", "Lecture"],
+        [2, "Smarch", "2w", "Lecture"],
+        [1, np.nan, "1w", "Lecture"],
+        [3, "Jan", "6w", "Webinar"],
+        [3, "Feb", "5w", "Webinar"],
+        [1, "Jan", "2w", "Contract"],
+        [1, "Mar", "2w", "Contract"],
+        [2, "Mar", "3w", "Contract"],
+        # Reported once, for the month, though its activity does not map either.
+        [4, "Smarch", "1w", "MOS Test"],
+    ]), YEAR)
+    expected = pd.DataFrame([
+        ["unknown month", "Month", "Smarch", 3, 3],
+        ["unmapped activity", "Activity", "Contract", 3, 2],
+        ["invalid date", "Year/Month/Week", f"{YEAR} Feb 5w", 1, 1],
+        ["unknown month", "Month", "(blank)", 1, 1],
+        ["unknown week", "Week", "6w", 1, 1],
+    ], columns=REPORT_COLUMNS)
+    pd.testing.assert_frame_equal(normalization_report(df), expected, check_dtype=False)
+    assert normalization_report(df.iloc[:1]).empty
@@ -0,0 +1,72 @@
+import os
+import shutil
+
+import pytest
+
+from kol_core.constants import YEAR
+from kol_core.refresher import REFRESH_ERROR, WARM_ERROR, DataRefresher
+from kol_core.store import PartitionedStore
+
+@pytest.fixture
+def workbooks(tmp_path, year_workbooks):
+    return {year: shutil.copy2(path, tmp_path / os.path.basename(path)) for year, path in year_workbooks.items()}
+
+def make_refresher(tmp_path, workbooks, warm=None):
+    return DataRefresher(PartitionedStore(tmp_path / "store"), workbooks, "contracts", "tracking", interval=60, warm=warm)
+
+def test_start_publishes_versions_and_warms_only_the_default_year(tmp_path, workbooks):
+    warmed = []
+    refresher = make_refresher(tmp_path, workbooks, warm=lambda year, version: warmed.append((year, version)))
+    try:
+        refresher.start()
+        store = refresher.store
+        assert refresher.years() == store.years() == [YEAR + 2, YEAR + 1, YEAR]
+        assert {year: refresher.version(year) for year in refresher.years()} == {year: store.version(year) for year in store.years()}
+        assert warmed == [(YEAR + 1, store.version(YEAR + 1))]
+    finally:
+        refresher.stop()
+    assert not refresher.refresh()
+    assert len(warmed) == 1
+
+def test_start_on_a_filled_store_publishes_without_waiting(tmp_path, workbooks):
+    make_refresher(tmp_path, workbooks).refresh()
+    warmed = []
+    refresher = make_refresher(tmp_path, workbooks, warm=lambda year, version: warmed.append(year))
+    refresher._publish(warm=False)
+    assert refresher.years() == [YEAR + 2, YEAR + 1, YEAR] and warmed == []
+    # The background pass ingests nothing new but still warms the default year.
+    assert refresher.refresh() and warmed == [YEAR + 1]
+
+def test_missing_workbook_error_clears_when_it_returns(tmp_path, workbooks):
+    refresher = make_refresher(tmp_path, workbooks)
+    refresher.refresh()
+    path = workbooks[YEAR]
+    os.rename(path, f"{path}.moved")
+    refresher.refresh()
+    assert "file not found" in refresher.errors[path]
+    os.rename(f"{path}.moved", path)
+    refresher.refresh()
+    assert path not in refresher.errors
+
+def test_warm_failure_is_recorded_and_cleared(tmp_path, workbooks):
+    def warm(year, version):
+        if fail: raise RuntimeError("boom")
+    fail = True
+    refresher = make_refresher(tmp_path, workbooks, warm=warm)
+    refresher.refresh()
+    assert refresher.errors[WARM_ERROR] == f"Warm-up Error ({YEAR + 1}): RuntimeError: boom"
+    # Published anyway, and not warmed again until the version changes.
+    assert refresher.version(YEAR + 1) is not None
+    fail = False
+    refresher._warmed = None
+    refresher.refresh()
+    assert WARM_ERROR not in refresher.errors
+
+def test_refresh_failure_on_the_thread_is_recorded(tmp_path, workbooks):
+    refresher = make_refresher(tmp_path, workbooks)
+    def refresh():
+        raise OSError("disk gone")
+    refresher.refresh = refresh
+    refresher.stop()
+    refresher._run()
+    assert refresher.errors[REFRESH_ERROR] == "Data Refresh Error: OSError: disk gone"
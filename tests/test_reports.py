@@ -0,0 +1,55 @@
+import argparse
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from kol_core.constants import YEAR
+from kol_core.incremental import IncrementalDashboard
+from kol_core.reports import MANIFEST_NAME, as_of_arg, generate_reports
+
+AS_OF = pd.Timestamp(YEAR, 11, 30)
+
+@pytest.fixture
+def dashboard(frames):
+    df_plan, df_actual = frames
+    df_dashboard, df_actual_to_date, _ = IncrementalDashboard(YEAR).update(df_plan, df_actual).dashboard(AS_OF)
+    return df_dashboard, df_actual_to_date
+
+def manifest(out_dir):
+    with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f: return json.load(f)
+
+def test_rerun_renders_nothing(dashboard, tmp_path):
+    first = generate_reports(*dashboard, AS_OF, YEAR, tmp_path, workers=1)
+    assert first["rendered"] == dashboard[0]['KOL_ID'].nunique()
+    assert generate_reports(*dashboard, AS_OF, YEAR, tmp_path, workers=1) == {"rendered": 0, "unchanged": first["rendered"], "removed": 0}
+
+def test_years_do_not_prune_each_other(dashboard, tmp_path):
+    df_dashboard, df_actual_to_date = dashboard
+    generate_reports(df_dashboard, df_actual_to_date, AS_OF, YEAR, tmp_path, workers=1)
+    df_next = df_dashboard[df_dashboard['KOL_ID'] < df_dashboard['KOL_ID'].median()]
+    counts = generate_reports(df_next, df_actual_to_date, AS_OF, YEAR + 1, tmp_path, workers=1)
+    assert counts["removed"] == 0
+    years = manifest(tmp_path)["years"]
+    assert len(years[str(YEAR)]["reports"]) == df_dashboard['KOL_ID'].nunique()
+    assert len(years[str(YEAR + 1)]["reports"]) == df_next['KOL_ID'].nunique()
+    files = [e["file"] for section in years.values() for e in section["reports"].values()]
+    assert len(set(files)) == len(files) and all(os.path.exists(tmp_path / f) for f in files)
+
+def test_prune_within_year(dashboard, tmp_path):
+    df_dashboard, df_actual_to_date = dashboard
+    generate_reports(df_dashboard, df_actual_to_date, AS_OF, YEAR, tmp_path, workers=1)
+    dropped = df_dashboard['KOL_ID'].iloc[0]
+    counts = generate_reports(df_dashboard[df_dashboard['KOL_ID'] != dropped], df_actual_to_date, AS_OF, YEAR, tmp_path, workers=1)
+    assert counts["removed"] == 1
+    assert str(dropped) not in manifest(tmp_path)["years"][str(YEAR)]["reports"]
+
+@pytest.mark.parametrize("value", ["2025-13-01", "Novembre", ""])
+def test_as_of_arg_rejects_bad_dates(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        as_of_arg(value)
+
+def test_as_of_arg_accepts_months_and_dates():
+    assert as_of_arg("November") == "November"
+    assert as_of_arg("2025-11-15") == pd.Timestamp(2025, 11, 15)
@@ -0,0 +1,94 @@
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import write_workbook
+from kol_core.constants import YEAR
+from kol_core.store import PartitionedStore
+
+TABS = ("contracts", "tracking")
+
+def kol_ids(df):
+    return set(df['KOL_ID'].astype(int))
+
+def kol_range(first, last):
+    return set(range(first, last + 1))
+
+def sync_all(store, workbooks):
+    return [store.sync_workbook(path, *TABS, year) for year, path in workbooks.items()]
+
+@pytest.fixture
+def store(tmp_path, year_workbooks):
+    store = PartitionedStore(tmp_path / "store")
+    assert sync_all(store, year_workbooks) == [True, True]
+    return store
+
+def versions(store):
+    return {year: store.version(year) for year in store.years()}
+
+def test_contracts_are_loaded_for_every_year_they_overlap(store):
+    assert store.years() == [YEAR + 2, YEAR + 1, YEAR]
+    assert kol_ids(store.load(YEAR)[0]) == kol_range(100001, 100040)
+    assert kol_ids(store.load(YEAR + 2)[0]) == kol_range(100061, 100065)
+    assert store.load(YEAR + 3) == (None, None)
+    df_plan = store.load(YEAR + 1)[0]
+    assert kol_ids(df_plan) == kol_range(100031, 100065)
+    # KOLs in both workbooks take their contract rows from the newer one.
+    start_year = df_plan.groupby('KOL_ID')['Contract Start'].min().dt.year
+    assert set(start_year[start_year == YEAR].index.astype(int)) == kol_range(100031, 100035)
+
+def test_tracking_runs_from_each_kols_first_contract_year(store, year_sources):
+    raw_actual = {year: frames[1] for year, frames in year_sources.items()}
+    df_actual = store.load(YEAR)[1]
+    assert (df_actual['Year'] == YEAR).all() and len(df_actual) == len(raw_actual[YEAR])
+
+    df_actual = store.load(YEAR + 1)[1]
+    assert (df_actual['Year'] == YEAR + 1).sum() == len(raw_actual[YEAR + 1])
+    # Of the earlier year, only KOLs whose (newest) contract started then: not 100036-100040.
+    earlier = df_actual[df_actual['Year'] == YEAR]
+    carried = raw_actual[YEAR][raw_actual[YEAR]['KOL_ID'].between(100031, 100035)]
+    assert len(earlier) == len(carried) and kol_ids(earlier) == kol_ids(carried)
+
+    # Contracts active in YEAR + 2 all started in YEAR + 1, so nothing from YEAR is read.
+    df_actual = store.load(YEAR + 2)[1]
+    assert set(df_actual['Year']) == {YEAR + 1}
+    assert len(df_actual) == raw_actual[YEAR + 1]['KOL_ID'].between(100061, 100065).sum()
+
+def test_unchanged_workbooks_are_not_ingested_again(store, year_workbooks):
+    before = versions(store)
+    assert sync_all(store, year_workbooks) == [False, False]
+    reopened = PartitionedStore(store.root)
+    assert sync_all(reopened, year_workbooks) == [False, False]
+    assert versions(store) == versions(reopened) == before
+
+def test_source_token_change_reingests(store, year_workbooks, monkeypatch):
+    before = versions(store)
+    token = store.manifest["sources"][str(YEAR)]["token"]
+    monkeypatch.setattr("kol_core.store.NORMALIZE_VERSION", "normalize-test")
+    assert store.sync_workbook(year_workbooks[YEAR], *TABS, YEAR)
+    assert store.manifest["sources"][str(YEAR)]["token"] != token
+    # Every year that reads a partition of the re-ingested source gets a new version.
+    after = versions(store)
+    assert after[YEAR] != before[YEAR] and after[YEAR + 1] != before[YEAR + 1]
+    assert after[YEAR + 2] == before[YEAR + 2]
+
+def test_changed_source_replaces_only_its_own_partitions(store, tmp_path, make_year_frames):
+    before = versions(store)
+    df_plan_before, df_actual_before = store.load(YEAR)
+    partitions_before = {p: e for p, e in store.manifest["partitions"].items() if e["source"] == str(YEAR)}
+
+    # The new version has no contracts running into YEAR + 2.
+    df_plan, df_actual = make_year_frames(YEAR + 1, n_kols=30, id_offset=35, seed=2)
+    assert store.sync_workbook(write_workbook(tmp_path / "changed.xlsx", df_plan, df_actual), *TABS, YEAR + 1)
+
+    assert store.years() == [YEAR + 1, YEAR]
+    assert not os.path.exists(os.path.join(store.root, "plan", f"year={YEAR + 2}", f"source={YEAR + 1}.feather"))
+    assert {p: e for p, e in store.manifest["partitions"].items() if e["source"] == str(YEAR)} == partitions_before
+    assert store.version(YEAR) == before[YEAR]
+    df_plan_after, df_actual_after = store.load(YEAR)
+    pd.testing.assert_frame_equal(df_plan_after, df_plan_before)
+    pd.testing.assert_frame_equal(df_actual_after, df_actual_before)
+
+    assert store.version(YEAR + 1) != before[YEAR + 1]
+    assert (store.load(YEAR + 1)[1]['Year'] == YEAR + 1).sum() == len(df_actual)